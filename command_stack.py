@@ -1,9 +1,71 @@
 from typing import Any, List, Dict, Set, Callable
 from pathlib import Path
 import json
+from json.encoder import encode_basestring_ascii
+import os
+import concurrent.futures
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QToolButton, QListWidgetItem
-from PyQt6.QtGui import QColor
 from PyQt6.QtCore import Qt
+from entity_list_model import EntityListModel
+
+# orjson is optional; both parsers take the raw bytes of a file
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+def _load_json(path) -> Any:
+    """Read and parse a JSON file"""
+    return _loads(Path(path).read_bytes())
+
+# Entity data stored under gui.manifest_data[source][type][id] is treated as
+# read-only: commands insert their captured dicts by reference instead of
+# copying them, so anything that needs to modify an entry must copy it first.
+
+# Manifests written by commands are cached by path so later readers can skip
+# re-parsing a file we just wrote. Entries are keyed on mtime/size so any
+# outside edit to the file invalidates them.
+_MANIFEST_CACHE_SIZE = 32
+_MANIFEST_CACHE: Dict[Path, tuple] = {}
+
+def cache_manifest(path: Path, data: dict) -> None:
+    """Remember manifest data that is now on disk at path"""
+    try:
+        st = path.stat()
+    except OSError:
+        _MANIFEST_CACHE.pop(path, None)
+        return
+    _MANIFEST_CACHE.pop(path, None)
+    _MANIFEST_CACHE[path] = ((st.st_mtime_ns, st.st_size), data)
+    while len(_MANIFEST_CACHE) > _MANIFEST_CACHE_SIZE:
+        del _MANIFEST_CACHE[next(iter(_MANIFEST_CACHE))]
+
+def get_manifest(path: Path) -> dict:
+    """Load a manifest file, reusing the cached data if the file is unchanged.
+    The returned dict is shared, so callers must copy it before modifying."""
+    st = path.stat()
+    cached = _MANIFEST_CACHE.get(path)
+    if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+    data = _load_json(path)
+    cache_manifest(path, data)
+    return data
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temporary file next to path and swap it into place"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=0) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _dump_manifest(manifest_data: dict) -> bytes:
+    """Compact JSON for an entity manifest. Manifests are almost always just
+    {"ids": [...]}, so that shape is emitted directly; anything else goes through json.dumps"""
+    ids = manifest_data.get("ids")
+    if len(manifest_data) == 1 and isinstance(ids, list) and all(type(x) is str for x in ids):
+        return ('{"ids":[' + ','.join(map(encode_basestring_ascii, ids)) + ']}').encode('ascii')
+    return json.dumps(manifest_data, separators=(',', ':')).encode('ascii')
 
 class Command:
     """Base class for all commands"""
@@ -28,7 +90,12 @@ class CommandStack:
         self.is_executing = False  # Flag to prevent recursive command execution
         self.modified_files: Set[Path] = set()  # Track files with unsaved changes
         self.file_data: Dict[Path, dict] = {}  # Store current data for each file
+        self.data_generation = 0  # Bumped whenever file_data changes, so readers can cache lookups into it
         self.data_change_callbacks: Dict[Path, List[Callable]] = {}  # Callbacks for data changes
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='cmdstack-io')
+        self.pending_writes: List[concurrent.futures.Future] = []  # Background writes not yet waited on
+        self.compact_files: Set[Path] = set()  # Files written without indentation, reformatted on save
+        self._verified_dirs: Set[Path] = set()  # Directories already known to exist
         print("Initialized new CommandStack")
         
     def register_data_change_callback(self, file_path: Path, callback: Callable) -> None:
@@ -66,6 +133,12 @@ class CommandStack:
         """Update the stored data for a file"""
         print(f"Updating stored data for file: {file_path}")
         self.file_data[file_path] = data.copy()  # Store a copy to prevent reference issues
+        self.data_generation += 1
+        
+    def remove_file_data(self, file_path: Path) -> None:
+        """Forget the stored data for a file"""
+        if self.file_data.pop(file_path, None) is not None:
+            self.data_generation += 1
         
     def get_file_data(self, file_path: Path) -> dict:
         """Get the current data for a file"""
@@ -259,22 +332,67 @@ class CommandStack:
         self.modified_files.clear()
         print("Marked all changes as saved")
         
+    def mark_saved(self, saved_data: Dict[Path, dict]) -> None:
+        """Mark files as saved, given the stored data each was saved from. A file whose data
+        was replaced in the meantime keeps its unsaved changes"""
+        for file_path, data in saved_data.items():
+            if self.file_data.get(file_path) is data:
+                self.modified_files.discard(file_path)
+        
     def get_modified_files(self) -> Set[Path]:
         """Get the set of files that have unsaved changes"""
         print(f"Getting modified files: {self.modified_files}")
         return self.modified_files.copy()
         
+    def ensure_parent_dir(self, file_path: Path) -> None:
+        """Create the parent directory of a file, once per directory"""
+        parent = file_path.parent
+        if parent not in self._verified_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._verified_dirs.add(parent)
+        
+    def submit_write(self, file_path: Path, data: bytes) -> concurrent.futures.Future:
+        """Write already serialized data to a file on the background IO thread"""
+        future = self._io_pool.submit(_atomic_write_bytes, file_path, data)
+        self.pending_writes.append(future)
+        return future
+        
+    def wait_for_writes(self) -> bool:
+        """Block until all background writes have finished. Returns False if any failed"""
+        success = True
+        for future in self.pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Background write failed: {str(e)}")
+                success = False
+        self.pending_writes.clear()
+        return success
+        
+    def flush_pretty(self) -> None:
+        """Rewrite files that were written compactly with the usual indented formatting"""
+        self.wait_for_writes()
+        for file_path in self.compact_files:
+            try:
+                if not file_path.exists():
+                    continue
+                data = _load_json(file_path)
+                _atomic_write_bytes(file_path, json.dumps(data, indent=4).encode('ascii'))
+            except Exception as e:
+                print(f"Error reformatting file {file_path}: {str(e)}")
+        self.compact_files.clear()
+        
     def save_file(self, file_path: Path, data: dict) -> bool:
         """Save changes to a specific file"""
+        self.wait_for_writes()
         try:
             print(f"Saving file: {file_path}")
             
             # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self.ensure_parent_dir(file_path)
             
             # Save the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            _atomic_write_bytes(file_path, json.dumps(data, indent=4).encode('ascii'))
             
             # Remove from modified files
             self.modified_files.discard(file_path)
@@ -1082,6 +1200,7 @@ class AddPropertyCommand(Command):
                     # Store data path and value for context menu
                     toggle_btn.setProperty("data_path", self.data_path + [self.prop_name])
                     toggle_btn.setProperty("original_value", default_value)
+                    toggle_btn.setProperty("is_property_label", True)
                     
                     # Add context menu
                     toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -1131,6 +1250,7 @@ class AddPropertyCommand(Command):
                     # Add context menu to label
                     label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
                     label.setProperty("data_path", self.data_path + [self.prop_name])
+                    label.setProperty("is_property_label", True)
                     label.customContextMenuRequested.connect(
                         lambda pos, w=label, v=default_value: self.gui.show_context_menu(w, pos, v)
                     )
@@ -1609,12 +1729,10 @@ class CreateFileFromCopy(Command):
                 base_file = None if not self.gui.base_game_folder else self.gui.base_game_folder / "uniforms" / f"{self.source_file}.uniforms"
 
                 if mod_file.exists():
-                    with open(mod_file, 'r', encoding='utf-8') as f:
-                        self.source_data = json.load(f)
+                    self.source_data = _load_json(mod_file)
                     is_base_game = False
                 elif base_file and base_file.exists():
-                    with open(base_file, 'r', encoding='utf-8') as f:
-                        self.source_data = json.load(f)
+                    self.source_data = _load_json(base_file)
                     is_base_game = True
 
                 # Create target file path
@@ -1649,8 +1767,7 @@ class CreateFileFromCopy(Command):
             if self.manifest_file_path:
                 manifest_data = {"ids": []}
                 if self.manifest_file_path.exists():
-                    with open(self.manifest_file_path, 'r', encoding='utf-8') as f:
-                        manifest_data = json.load(f)
+                    manifest_data = get_manifest(self.manifest_file_path)
                         
                 # Store old manifest data for undo (deep copy)
                 self.old_manifest_data = json.loads(json.dumps(manifest_data))
@@ -1685,11 +1802,13 @@ class CreateFileFromCopy(Command):
             if self.manifest_file_path:
                 with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.new_manifest_data, f, indent=4)
+                cache_manifest(self.manifest_file_path, self.new_manifest_data)
                 
                 # Update the GUI's manifest data
                 if self.source_type not in self.gui.manifest_data['mod']:
                     self.gui.manifest_data['mod'][self.source_type] = {}
                 self.gui.manifest_data['mod'][self.source_type][self.new_name] = self.source_data
+                self.gui.invalidate_file_index(self.source_type)
             
             # Update the appropriate list based on file type
             self.update_list_for_type()
@@ -1715,11 +1834,13 @@ class CreateFileFromCopy(Command):
                 print(f"Old manifest data: {self.old_manifest_data}")
                 with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.old_manifest_data, f, indent=4)
+                cache_manifest(self.manifest_file_path, self.old_manifest_data)
                     
                 # Remove from GUI's manifest data
                 if self.source_type in self.gui.manifest_data['mod']:
                     print(f"Removing {self.new_name} from GUI manifest data")
                     self.gui.manifest_data['mod'][self.source_type].pop(self.new_name, None)
+                    self.gui.invalidate_file_index(self.source_type)
                 
             # Update the appropriate list based on file type
             self.update_list_for_type()
@@ -1727,7 +1848,7 @@ class CreateFileFromCopy(Command):
             # Remove from command stack's file data
             if self.created_file_path:
                 print(f"Removing file data from command stack")
-                self.gui.command_stack.file_data.pop(self.created_file_path, None)
+                self.gui.command_stack.remove_file_data(self.created_file_path)
             
             # Remove from modified files set
             if self.created_file_path:
@@ -1766,8 +1887,10 @@ class CreateFileFromCopy(Command):
                 self.gui.uniforms_list.clear()
                 # Add mod files first
                 uniforms_folder = self.gui.current_folder / "uniforms"
+                mod_stems = set()
                 if uniforms_folder.exists():
                     for file in sorted(uniforms_folder.glob("*.uniforms")):
+                        mod_stems.add(file.stem)
                         item = QListWidgetItem(file.stem)
                         item.setToolTip("Mod version")
                         self.gui.uniforms_list.addItem(item)
@@ -1776,12 +1899,11 @@ class CreateFileFromCopy(Command):
                     base_uniforms_folder = self.gui.base_game_folder / "uniforms"
                     if base_uniforms_folder.exists():
                         for file in sorted(base_uniforms_folder.glob("*.uniforms")):
-                            # Always add base game files, even if they exist in mod folder
+                            # Skip base game files the mod overrides
+                            if file.stem in mod_stems:
+                                continue
                             item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
+                            self.gui.style_base_game_item(item)
                             item.setToolTip("Base game version")
                             self.gui.uniforms_list.addItem(item)
                 return
@@ -1807,27 +1929,20 @@ class CreateFileFromCopy(Command):
             # Special handling for units to filter by type
             if self.source_type == 'unit':
                 # Update all units list first
-                self.gui.all_units_list.clear()
                 # Add mod files first
                 mod_entities = self.gui.current_folder / "entities"
+                mod_ids = []
                 if mod_entities.exists():
-                    for file in sorted(mod_entities.glob("*.unit")):
-                        item = QListWidgetItem(file.stem)
-                        item.setToolTip("Mod version")
-                        self.gui.all_units_list.addItem(item)
+                    mod_ids = [file.stem for file in sorted(mod_entities.glob("*.unit"))]
+                self.gui.all_units_model.set_rows(mod_ids, [])
                 # Then add base game files (grayed out)
                 if self.gui.base_game_folder:
                     base_entities = self.gui.base_game_folder / "entities"
                     if base_entities.exists():
-                        for file in sorted(base_entities.glob("*.unit")):
-                            # Always add base game files, even if they exist in mod folder
-                            item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                            item.setToolTip("Base game version")
-                            self.gui.all_units_list.addItem(item)
+                        # Skip base game files the mod overrides
+                        mod_stems = set(mod_ids)
+                        self.gui.all_units_model.append_rows(
+                            [file.stem for file in sorted(base_entities.glob("*.unit")) if file.stem not in mod_stems], True)
 
                 # Update buildable units list
                 if hasattr(self.gui, 'current_data') and self.gui.current_data:
@@ -1845,10 +1960,7 @@ class CreateFileFromCopy(Command):
                             base_file = base_entities / f"{unit_id}.unit"
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
-                                item.setForeground(QColor(150, 150, 150))
-                                font = item.font()
-                                font.setItalic(True)
-                                item.setFont(font)
+                                self.gui.style_base_game_item(item)
                                 item.setToolTip("Base game version")
                                 self.gui.units_list.addItem(item)
 
@@ -1867,40 +1979,53 @@ class CreateFileFromCopy(Command):
                             base_file = base_entities / f"{unit_id}.unit"
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
-                                item.setForeground(QColor(150, 150, 150))
-                                font = item.font()
-                                font.setItalic(True)
-                                item.setFont(font)
+                                self.gui.style_base_game_item(item)
                                 item.setToolTip("Base game version")
                                 self.gui.strikecraft_list.addItem(item)
                 return
                 
             # Update each list widget
             for list_widget in list_widgets:
-                # Clear and repopulate the list
-                list_widget.clear()
-                
-                # Add mod files first
                 mod_entities = self.gui.current_folder / "entities"
-                if mod_entities.exists():
-                    for file in sorted(mod_entities.glob(f"*.{self.source_type}")):
-                        item = QListWidgetItem(file.stem)
-                        item.setToolTip("Mod version")
-                        list_widget.addItem(item)
                 
-                # Then add base game files (grayed out)
-                if self.gui.base_game_folder:
-                    base_entities = self.gui.base_game_folder / "entities"
-                    if base_entities.exists():
-                        for file in sorted(base_entities.glob(f"*.{self.source_type}")):
-                            # Always add base game files, even if they exist in mod folder
+                # Model-backed lists take the whole id list at once
+                model = list_widget.model()
+                if isinstance(model, EntityListModel):
+                    base_entities = self.gui.base_game_folder / "entities" if self.gui.base_game_folder else None
+                    mod_ids = [file.stem for file in sorted(mod_entities.glob(f"*.{self.source_type}"))] if mod_entities.exists() else []
+                    mod_stems = set(mod_ids)
+                    base_ids = [file.stem for file in sorted(base_entities.glob(f"*.{self.source_type}")) if file.stem not in mod_stems] if base_entities and base_entities.exists() else []
+                    model.set_rows(mod_ids, base_ids)
+                    continue
+                
+                # Clear and repopulate the list
+                list_widget.setUpdatesEnabled(False)
+                try:
+                    list_widget.clear()
+                
+                    # Add mod files first
+                    mod_stems = set()
+                    if mod_entities.exists():
+                        for file in sorted(mod_entities.glob(f"*.{self.source_type}")):
+                            mod_stems.add(file.stem)
                             item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                            item.setToolTip("Base game version")
+                            item.setToolTip("Mod version")
                             list_widget.addItem(item)
+                
+                    # Then add base game files (grayed out)
+                    if self.gui.base_game_folder:
+                        base_entities = self.gui.base_game_folder / "entities"
+                        if base_entities.exists():
+                            for file in sorted(base_entities.glob(f"*.{self.source_type}")):
+                                # Skip base game files the mod overrides
+                                if file.stem in mod_stems:
+                                    continue
+                                item = QListWidgetItem(file.stem)
+                                self.gui.style_base_game_item(item)
+                                item.setToolTip("Base game version")
+                                list_widget.addItem(item)
+                finally:
+                    list_widget.setUpdatesEnabled(True)
         except Exception as e:
             print(f"Error updating list for type {self.source_type}: {str(e)}")
 
@@ -1912,8 +2037,7 @@ class CreateLocalizedText(Command):
         
         # Load or create initial data
         try:
-            with open(text_file, 'r', encoding='utf-8') as f:
-                old_data = json.load(f)
+            old_data = _load_json(text_file)
         except (FileNotFoundError, json.JSONDecodeError):
             old_data = {}
             
@@ -1937,6 +2061,7 @@ class CreateLocalizedText(Command):
             if self.language not in self.gui.all_localized_strings['mod']:
                 self.gui.all_localized_strings['mod'][self.language] = {}
             self.gui.all_localized_strings['mod'][self.language][self.key] = self.text
+            self.gui.invalidate_localized_indexes(self.language)
             
             return True
             
@@ -1952,6 +2077,7 @@ class CreateLocalizedText(Command):
             # Remove the key from GUI's in-memory strings
             if self.language in self.gui.all_localized_strings['mod']:
                 self.gui.all_localized_strings['mod'][self.language].pop(self.key, None)
+                self.gui.invalidate_localized_indexes(self.language)
             
             return True
             
@@ -2156,13 +2282,11 @@ class DeleteFileCommand(Command):
                 raise ValueError(f"File does not exist: {self.file_path}")
 
             # Store file contents for undo
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.file_data = json.load(f)
+            self.file_data = _load_json(self.file_path)
 
             # Handle manifest if needed
             if self.remove_manifest and self.manifest_file_path and self.manifest_file_path.exists():
-                with open(self.manifest_file_path, 'r', encoding='utf-8') as f:
-                    manifest_data = json.load(f)
+                manifest_data = get_manifest(self.manifest_file_path)
                 # Store old manifest data for undo (deep copy)
                 self.old_manifest_data = json.loads(json.dumps(manifest_data))
                 # Create new manifest data without this file (deep copy)
@@ -2195,11 +2319,13 @@ class DeleteFileCommand(Command):
             if self.remove_manifest and self.manifest_file_path and self.new_manifest_data:
                 with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.new_manifest_data, f, indent=4)
+                cache_manifest(self.manifest_file_path, self.new_manifest_data)
 
             # Always remove from GUI's manifest data when deleting the file
             # This ensures the item is removed from the list view
             if self.file_type in self.gui.manifest_data['mod']:
                 self.gui.manifest_data['mod'][self.file_type].pop(self.file_id, None)
+                self.gui.invalidate_file_index(self.file_type)
 
             # Update the appropriate list
             self.update_list_for_type()
@@ -2223,12 +2349,14 @@ class DeleteFileCommand(Command):
             if self.remove_manifest and self.manifest_file_path and self.old_manifest_data:
                 with open(self.manifest_file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.old_manifest_data, f, indent=4)
+                cache_manifest(self.manifest_file_path, self.old_manifest_data)
 
             # Restore GUI's manifest data if we had stored it
             if self.manifest_mod_data is not None:
                 if self.file_type not in self.gui.manifest_data['mod']:
                     self.gui.manifest_data['mod'][self.file_type] = {}
-                self.gui.manifest_data['mod'][self.file_type][self.file_id] = json.loads(json.dumps(self.manifest_mod_data))
+                self.gui.manifest_data['mod'][self.file_type][self.file_id] = self.manifest_mod_data
+                self.gui.invalidate_file_index(self.file_type)
 
             # Update the appropriate list
             self.update_list_for_type()
@@ -2251,8 +2379,10 @@ class DeleteFileCommand(Command):
                 self.gui.uniforms_list.clear()
                 # Add mod files first
                 uniforms_folder = self.gui.current_folder / "uniforms"
+                mod_stems = set()
                 if uniforms_folder.exists():
                     for file in sorted(uniforms_folder.glob("*.uniforms")):
+                        mod_stems.add(file.stem)
                         item = QListWidgetItem(file.stem)
                         item.setToolTip("Mod version")
                         self.gui.uniforms_list.addItem(item)
@@ -2261,12 +2391,11 @@ class DeleteFileCommand(Command):
                     base_uniforms_folder = self.gui.base_game_folder / "uniforms"
                     if base_uniforms_folder.exists():
                         for file in sorted(base_uniforms_folder.glob("*.uniforms")):
-                            # Always add base game files, even if they exist in mod folder
+                            # Skip base game files the mod overrides
+                            if file.stem in mod_stems:
+                                continue
                             item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
+                            self.gui.style_base_game_item(item)
                             item.setToolTip("Base game version")
                             self.gui.uniforms_list.addItem(item)
                 return
@@ -2292,27 +2421,20 @@ class DeleteFileCommand(Command):
             # Special handling for units to filter by type
             if self.file_type == 'unit':
                 # Update all units list first
-                self.gui.all_units_list.clear()
                 # Add mod files first
                 mod_entities = self.gui.current_folder / "entities"
+                mod_ids = []
                 if mod_entities.exists():
-                    for file in sorted(mod_entities.glob("*.unit")):
-                        item = QListWidgetItem(file.stem)
-                        item.setToolTip("Mod version")
-                        self.gui.all_units_list.addItem(item)
+                    mod_ids = [file.stem for file in sorted(mod_entities.glob("*.unit"))]
+                self.gui.all_units_model.set_rows(mod_ids, [])
                 # Then add base game files (grayed out)
                 if self.gui.base_game_folder:
                     base_entities = self.gui.base_game_folder / "entities"
                     if base_entities.exists():
-                        for file in sorted(base_entities.glob("*.unit")):
-                            # Always add base game files, even if they exist in mod folder
-                            item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                            item.setToolTip("Base game version")
-                            self.gui.all_units_list.addItem(item)
+                        # Skip base game files the mod overrides
+                        mod_stems = set(mod_ids)
+                        self.gui.all_units_model.append_rows(
+                            [file.stem for file in sorted(base_entities.glob("*.unit")) if file.stem not in mod_stems], True)
 
                     # Update buildable units list
                     if hasattr(self.gui, 'current_data') and self.gui.current_data:
@@ -2330,10 +2452,7 @@ class DeleteFileCommand(Command):
                                 base_file = base_entities / f"{unit_id}.unit"
                                 if base_file.exists():
                                     item = QListWidgetItem(unit_id)
-                                    item.setForeground(QColor(150, 150, 150))
-                                    font = item.font()
-                                    font.setItalic(True)
-                                    item.setFont(font)
+                                    self.gui.style_base_game_item(item)
                                     item.setToolTip("Base game version")
                                     self.gui.units_list.addItem(item)
 
@@ -2352,40 +2471,53 @@ class DeleteFileCommand(Command):
                             base_file = base_entities / f"{unit_id}.unit"
                             if base_file.exists():
                                 item = QListWidgetItem(unit_id)
-                                item.setForeground(QColor(150, 150, 150))
-                                font = item.font()
-                                font.setItalic(True)
-                                item.setFont(font)
+                                self.gui.style_base_game_item(item)
                                 item.setToolTip("Base game version")
                                 self.gui.strikecraft_list.addItem(item)
                 return
                 
             # Update each list widget
             for list_widget in list_widgets:
-                # Clear and repopulate the list
-                list_widget.clear()
-                
-                # Add mod files first
                 mod_entities = self.gui.current_folder / "entities"
-                if mod_entities.exists():
-                    for file in sorted(mod_entities.glob(f"*.{self.file_type}")):
-                        item = QListWidgetItem(file.stem)
-                        item.setToolTip("Mod version")
-                        list_widget.addItem(item)
                 
-                # Then add base game files (grayed out)
-                if self.gui.base_game_folder:
-                    base_entities = self.gui.base_game_folder / "entities"
-                    if base_entities.exists():
-                        for file in sorted(base_entities.glob(f"*.{self.file_type}")):
-                            # Always add base game files, even if they exist in mod folder
+                # Model-backed lists take the whole id list at once
+                model = list_widget.model()
+                if isinstance(model, EntityListModel):
+                    base_entities = self.gui.base_game_folder / "entities" if self.gui.base_game_folder else None
+                    mod_ids = [file.stem for file in sorted(mod_entities.glob(f"*.{self.file_type}"))] if mod_entities.exists() else []
+                    mod_stems = set(mod_ids)
+                    base_ids = [file.stem for file in sorted(base_entities.glob(f"*.{self.file_type}")) if file.stem not in mod_stems] if base_entities and base_entities.exists() else []
+                    model.set_rows(mod_ids, base_ids)
+                    continue
+                
+                # Clear and repopulate the list
+                list_widget.setUpdatesEnabled(False)
+                try:
+                    list_widget.clear()
+                
+                    # Add mod files first
+                    mod_stems = set()
+                    if mod_entities.exists():
+                        for file in sorted(mod_entities.glob(f"*.{self.file_type}")):
+                            mod_stems.add(file.stem)
                             item = QListWidgetItem(file.stem)
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                            item.setToolTip("Base game version")
+                            item.setToolTip("Mod version")
                             list_widget.addItem(item)
+                
+                    # Then add base game files (grayed out)
+                    if self.gui.base_game_folder:
+                        base_entities = self.gui.base_game_folder / "entities"
+                        if base_entities.exists():
+                            for file in sorted(base_entities.glob(f"*.{self.file_type}")):
+                                # Skip base game files the mod overrides
+                                if file.stem in mod_stems:
+                                    continue
+                                item = QListWidgetItem(file.stem)
+                                self.gui.style_base_game_item(item)
+                                item.setToolTip("Base game version")
+                                list_widget.addItem(item)
+                finally:
+                    list_widget.setUpdatesEnabled(True)
         except Exception as e:
             print(f"Error updating list for type {self.file_type}: {str(e)}")
 
@@ -2401,6 +2533,8 @@ class DeleteResearchSubjectCommand(Command):
         self.manifest_file = gui.current_folder / "entities" / "research_subject.entity_manifest"
         self.manifest_data = None
         self.subject_data = None
+        self._subject_bytes = None  # Serialized subject/manifest for undo
+        self._manifest_bytes = None
         
     def prepare(self) -> bool:
         """Prepare the command by gathering necessary data and validating the operation"""
@@ -2441,13 +2575,18 @@ class DeleteResearchSubjectCommand(Command):
             if self.full_delete:
                 # Store subject data for undo
                 if self.subject_file.exists():
-                    with open(self.subject_file, 'r', encoding='utf-8') as f:
-                        self.subject_data = json.load(f)
+                    self.subject_data = _load_json(self.subject_file)
 
                 # Store manifest data for undo
                 if self.manifest_file.exists():
-                    with open(self.manifest_file, 'r', encoding='utf-8') as f:
-                        self.manifest_data = json.load(f)
+                    self.manifest_data = get_manifest(self.manifest_file)
+
+                # Serialize once up front, so undo only has to hand the bytes to the IO thread.
+                # json.dumps escapes non-ASCII by default, so the output encodes as plain ASCII.
+                if self.subject_data:
+                    self._subject_bytes = json.dumps(self.subject_data, separators=(',', ':')).encode('ascii')
+                if self.manifest_data:
+                    self._manifest_bytes = _dump_manifest(self.manifest_data)
 
             return True
 
@@ -2465,26 +2604,31 @@ class DeleteResearchSubjectCommand(Command):
             self.gui.command_stack.modified_files.add(self.file_path)
 
             if self.full_delete:
+                # An undo may still be restoring the subject file in the background
+                self.gui.command_stack.wait_for_writes()
+                
                 # Delete the subject file
                 if self.subject_file.exists():
                     self.subject_file.unlink()
+                self.gui.command_stack.remove_file_data(self.subject_file)
 
                 # Update the manifest file
                 if self.manifest_file.exists() and self.manifest_data:
-                    manifest_data = json.loads(json.dumps(self.manifest_data))  # Deep copy
-                    if "ids" in manifest_data and self.subject_id in manifest_data["ids"]:
-                        manifest_data["ids"].remove(self.subject_id)
+                    if "ids" in self.manifest_data and self.subject_id in self.manifest_data["ids"]:
+                        # Only the ids list changes, so copy that instead of the whole manifest
+                        manifest_data = {**self.manifest_data, "ids": [x for x in self.manifest_data["ids"] if x != self.subject_id]}
                         # Update command stack's file data for manifest
                         self.gui.command_stack.update_file_data(self.manifest_file, manifest_data)
                         self.gui.command_stack.modified_files.add(self.manifest_file)
                         
                         # Write to file
-                        with open(self.manifest_file, 'w', encoding='utf-8') as f:
-                            json.dump(manifest_data, f, indent=4)
+                        _atomic_write_bytes(self.manifest_file, json.dumps(manifest_data, indent=4).encode('ascii'))
+                        cache_manifest(self.manifest_file, manifest_data)
 
                     # Remove from GUI's manifest data
                     if 'research_subject' in self.gui.manifest_data['mod']:
                         self.gui.manifest_data['mod']['research_subject'].pop(self.subject_id, None)
+                        self.gui.invalidate_file_index('research_subject')
 
             # Now do UI updates
             self.gui.update_data_value(self.array_path, self.new_value['research'][self.array_path[-1]])
@@ -2505,12 +2649,16 @@ class DeleteResearchSubjectCommand(Command):
             self.gui.command_stack.update_file_data(self.file_path, self.old_value)
             self.gui.command_stack.modified_files.add(self.file_path)
 
+            # Files are serialized compactly here but written on the command stack's IO thread,
+            # which a later save waits for. They get their indented formatting back when the user saves.
             if self.full_delete:
                 # Restore the subject file
                 if self.subject_data:
-                    self.subject_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(self.subject_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.subject_data, f, indent=4)
+                    self.gui.command_stack.ensure_parent_dir(self.subject_file)
+                    self.gui.command_stack.submit_write(self.subject_file, self._subject_bytes)
+                    self.gui.command_stack.compact_files.add(self.subject_file)
+                    # The research view reads it from here while the write is still pending
+                    self.gui.command_stack.update_file_data(self.subject_file, self.subject_data)
 
                 # Restore the manifest file
                 if self.manifest_data:
@@ -2519,17 +2667,20 @@ class DeleteResearchSubjectCommand(Command):
                     self.gui.command_stack.modified_files.add(self.manifest_file)
                     
                     # Write to file
-                    with open(self.manifest_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.manifest_data, f, indent=4)
+                    self.gui.command_stack.submit_write(self.manifest_file, self._manifest_bytes)
+                    self.gui.command_stack.compact_files.add(self.manifest_file)
 
                     # Restore GUI's manifest data
                     if self.subject_data:
                         if 'research_subject' not in self.gui.manifest_data['mod']:
                             self.gui.manifest_data['mod']['research_subject'] = {}
                         self.gui.manifest_data['mod']['research_subject'][self.subject_id] = self.subject_data
+                        self.gui.invalidate_file_index('research_subject')
 
             # Now do UI updates
             self.gui.update_data_value(self.array_path, self.old_value['research'][self.array_path[-1]])
+            
+            # The writes may still be in flight; the view reads the restored subject from memory
             self.gui.refresh_research_view()
             
             return True
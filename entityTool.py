@@ -1,35 +1,332 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                             QPushButton, QLabel, QFileDialog, QHBoxLayout, 
-                            QLineEdit, QListWidget, QComboBox, QTabWidget, QScrollArea, QGroupBox, QDialog, QSplitter, QToolButton,
-                            QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox, QListWidgetItem, QMenu, QTreeWidget, QTreeWidgetItem, QPlainTextEdit, QProgressBar, QApplication, QFormLayout, QInputDialog)
-from PyQt6.QtCore import (Qt, QTimer, QObject, QEvent, QPoint)
+                            QLineEdit, QListWidget, QListView, QAbstractItemView, QComboBox, QTabWidget, QScrollArea, QGroupBox, QDialog, QSplitter, QToolButton,
+                            QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox, QListWidgetItem, QMenu, QTreeWidget, QTreeWidgetItem, QPlainTextEdit, QProgressBar, QApplication, QFormLayout, QInputDialog,
+                            QStyledItemDelegate)
+from PyQt6.QtCore import (Qt, QTimer, QObject, QEvent, QPoint, QMetaObject, QEventLoop,
+                          QRunnable, QThreadPool, QModelIndex, pyqtSignal, pyqtSlot)
 from PyQt6.QtGui import (QDragEnterEvent, QDropEvent, QPixmap, QIcon, QKeySequence,
-                        QColor, QShortcut, QFont)
+                        QColor, QBrush, QShortcut, QFont, QPalette)
 import json
+import re
 import logging
 from pathlib import Path
-from research_view import ResearchTreeView
 import os
-from command_stack import CommandStack, EditValueCommand, AddPropertyCommand, DeleteArrayItemCommand, DeletePropertyCommand, ConditionalPropertyChangeCommand, CompositeCommand, TransformWidgetCommand, AddArrayItemCommand, CreateFileFromCopy, CreateLocalizedText, CreateResearchSubjectCommand, DeleteResearchSubjectCommand, DeleteFileCommand
+import sys
+from command_stack import CommandStack, EditValueCommand, AddPropertyCommand, DeleteArrayItemCommand, DeletePropertyCommand, ConditionalPropertyChangeCommand, CompositeCommand, TransformWidgetCommand, AddArrayItemCommand, CreateFileFromCopy, CreateLocalizedText, CreateResearchSubjectCommand, DeleteResearchSubjectCommand, DeleteFileCommand, get_manifest, cache_manifest, _atomic_write_bytes
+from entity_list_model import EntityListModel, BASE_GAME_ROLE
 from typing import List, Any
 import threading
-import pygame.mixer
 import traceback
+import collections
+import functools
+import concurrent.futures
 
 
 # add debug logging
 logging.basicConfig(level=logging.DEBUG)
 
+# orjson is optional; both parsers take the raw bytes of a file
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+def _load_json(path):
+    """Read and parse a JSON file"""
+    return _loads(Path(path).read_bytes())
+
+def _write_json(path, data) -> None:
+    """Write data as indented JSON through a temporary file, so a failed write leaves the old file intact.
+    json.dumps escapes non-ASCII by default, so the text is written as ASCII bytes without a text layer"""
+    _atomic_write_bytes(Path(path), json.dumps(data, indent=4).encode('ascii'))
+
+_BASE_DIR = Path(__file__).parent
+_ICON_DIR = _BASE_DIR / "icons"
+_STYLE_PATH = _BASE_DIR / "style.qss"
+
+@functools.lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """Load an icon from the icons folder, reusing it for every later request"""
+    return QIcon(str(_ICON_DIR / name))
+
+# File contents are cached per (path, mtime), so an edited file is read again
+@functools.lru_cache(maxsize=8)
+def _load_qss(path_str: str, mtime: float) -> str:
+    with open(path_str, 'r') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=8)
+def _load_config_json(path_str: str, mtime: float) -> dict:
+    return _load_json(path_str)
+
+# Finds a schema's fileExtension without parsing the whole file
+_FILE_EXTENSION_RE = re.compile(rb'"fileExtension"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Schema files from the last run as raw JSON text, keyed by path with an (mtime_ns, size) stamp
+_SCHEMA_CACHE_PATH = Path.home() / ".cache" / "sins2-entity-tool" / "schemas.json"
+
+def _read_schema_cache() -> dict:
+    """Return {path: (stamp, fileExtension, schema JSON text)} from the on-disk cache, or {} if it
+    is missing or unreadable. The schemas stay unparsed text until they are first used"""
+    try:
+        cache = _load_json(_SCHEMA_CACHE_PATH)
+        return {path: (tuple(entry["stamp"]), entry["ext"], entry["schema"]) for path, entry in cache.items()}
+    except Exception:
+        return {}
+
+def _write_schema_cache(cache: dict) -> None:
+    """Write {path: (stamp, fileExtension, schema JSON text)} to the on-disk cache"""
+    try:
+        _SCHEMA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        data = {path: {"stamp": list(stamp), "ext": ext, "schema": text} for path, (stamp, ext, text) in cache.items()}
+        _atomic_write_bytes(_SCHEMA_CACHE_PATH, json.dumps(data).encode('ascii'))
+    except Exception as e:
+        print(f"Error writing schema cache: {str(e)}")
+
+# Marks a value that is absent, where None is a valid value
+_MISSING = object()
+
+_pygame = None
+
+def _get_pygame():
+    """Import pygame on first use, it is only needed for sound playback"""
+    global _pygame
+    if _pygame is None:
+        import pygame
+        import pygame.mixer
+        _pygame = pygame
+    return _pygame
+
+def _get_mixer():
+    """Return pygame with its mixer initialized. The mixer is started on the first playback
+    and kept for the rest of the session, since starting it is slow"""
+    pygame = _get_pygame()
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    return pygame
+
+# Entity files are small and independent, so they are read on a shared pool
+_ENTITY_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix='entity-io')
+
+# The folder loaders run side by side on their own pool, since they submit work to _ENTITY_IO_POOL themselves
+_FOLDER_LOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=3, thread_name_prefix='folder-load')
+
+def _load_entity_files(entities_folder: Path, manifest_type: str, entity_ids: list, existing: dict) -> list:
+    """Load the entity files listed in a manifest concurrently. existing maps lower-cased file names
+    to the names on disk, since ids and files can differ in case on Windows.
+    Returns (entity_id, data, entity_file) in manifest order, data is None for files not in existing"""
+    def load_one(entity_id):
+        entity_id = sys.intern(entity_id)
+        file_name = f"{entity_id}.{manifest_type}"
+        actual_name = existing.get(file_name.lower())
+        if actual_name is None:
+            return entity_id, None, entities_folder / file_name
+        entity_file = entities_folder / actual_name
+        return entity_id, _load_json(entity_file), entity_file
+    return list(_ENTITY_IO_POOL.map(load_one, entity_ids))
+
+def _read_manifests(entities_folder: Path, source: str) -> dict:
+    """Read every entity manifest in entities_folder and the entities it lists.
+    source ('mod' or 'base game') is only used in log messages"""
+    result = {}
+    if not entities_folder.exists():
+        print(f"{source.capitalize()} entities folder not found: {entities_folder}")
+        return result
+    print(f"Found {source} entities folder: {entities_folder}")
+    
+    # One directory scan answers every "does this entity file exist" question.
+    # Names are compared lower-cased, as the game does on Windows
+    with os.scandir(entities_folder) as entries:
+        existing = {entry.name.lower(): entry.name for entry in entries}
+    
+    for name in sorted(existing.values()):
+        if not name.lower().endswith(".entity_manifest"):
+            continue
+        manifest_file = entities_folder / name
+        try:
+            manifest_type = sys.intern(manifest_file.stem)  # e.g., 'player', 'weapon'
+            print(f"Loading {source} manifest: {manifest_file}")
+            manifest_data = _load_json(manifest_file)
+            
+            if manifest_type not in result:
+                result[manifest_type] = {}
+                
+            # Load each referenced entity file
+            if 'ids' in manifest_data:
+                for entity_id, entity_data, entity_file in _load_entity_files(entities_folder, manifest_type, manifest_data['ids'], existing):
+                    if entity_data is not None:
+                        result[manifest_type][entity_id] = entity_data
+                    else:
+                        print(f"Referenced {source} entity file not found: {entity_file}")
+                        
+            print(f"Loaded {source} manifest {manifest_type} with {len(manifest_data.get('ids', []))} entries")
+        except Exception as e:
+            print(f"Error loading {source} manifest file {manifest_file}: {str(e)}")
+    return result
+
+def _scan_files(root, suffix: str, recursive: bool = True) -> tuple:
+    """Walk root with os.scandir, returning (frozenset of paths relative to root ending in suffix, using '/',
+    {directory: mtime_ns} for every directory visited). suffix is lower-case and matched case-insensitively"""
+    root = os.fspath(root)
+    found = set()
+    dir_mtimes = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffix):
+                        found.add(os.path.relpath(entry.path, root).replace('\\', '/'))
+        except OSError:
+            continue
+    return frozenset(found), dir_mtimes
+
+def _read_base_game_manifests(base_game_folder) -> dict:
+    """Read every base game entity manifest and the entities it lists"""
+    if not base_game_folder:
+        logging.warning("No base game folder configured")
+        return {}
+    print(f"Using base game folder: {base_game_folder}")
+    return _read_manifests(base_game_folder / "entities", "base game")
+
+class ManifestLoaderSignals(QObject):
+    finished = pyqtSignal(dict)
+
+class ManifestLoader(QRunnable):
+    """Reads the base game manifests on a pool thread. The pool owns the runnable and deletes it
+    once run() returns, so the GUI keeps the signals object, which also carries the result"""
+    def __init__(self, base_game_folder):
+        super().__init__()
+        self.base_game_folder = base_game_folder
+        self.signals = ManifestLoaderSignals()
+        self.signals.result = None
+        self.signals.done = threading.Event()
+
+    def run(self):
+        try:
+            result = _read_base_game_manifests(self.base_game_folder)
+        except Exception as e:
+            print(f"Error loading base game manifests: {str(e)}")
+            result = {}
+        self.signals.result = result
+        self.signals.done.set()
+        self.signals.finished.emit(result)
+
+class ConfigWriterSignals(QObject):
+    failed = pyqtSignal(str)
+
+class ConfigWriter(QRunnable):
+    """Writes config.json on a pool thread, swapping a temporary file into place"""
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.data = data
+        self.signals = ConfigWriterSignals()
+
+    def run(self):
+        try:
+            _atomic_write_bytes(Path('config.json'), self.data)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+def _vbox(parent, margins=(0, 0, 0, 0), spacing=None) -> QVBoxLayout:
+    """Create a QVBoxLayout on parent with its margins and spacing already set"""
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+def _debounce(parent, slot, interval: int = 120) -> QTimer:
+    """Create a single-shot timer that calls slot once its start() calls stop for interval ms"""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval)
+    timer.timeout.connect(slot)
+    return timer
+
+def _batched_list(view):
+    """Configure a list view holding one line of text per row, so large lists lay out in batches"""
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.LayoutMode.Batched)
+    view.setBatchSize(100)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    return view
+
+class LRUCache(collections.OrderedDict):
+    """Dict that keeps at most maxsize entries, dropping the least recently used"""
+    def __init__(self, maxsize: int = 128):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+class BaseGameItemDelegate(QStyledItemDelegate):
+    """Draws every item greyed out and in italics, for views that only show base game data"""
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.font.setItalic(True)
+        option.palette.setColor(QPalette.ColorRole.Text, QColor(150, 150, 150))
+
+class WheelEventFilter(QObject):
+    """Keeps scrolling the page from changing spinbox and combobox values"""
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Wheel:
+            return True  # Block wheel events
+        return False  # Let other events pass through
+
+# One filter is shared by every spinbox and combobox in the schema views
+_WHEEL_FILTER = WheelEventFilter()
+
 class GUILogHandler(logging.Handler):
     def __init__(self, log_widget):
         super().__init__()
         self.log_widget = log_widget
+        # Records are buffered and added to the widget in batches
+        self._pending = collections.deque()
+        self._timer = QTimer()
+        self._timer.setInterval(50)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
         
     def emit(self, record):
+        is_error = record.levelno >= logging.ERROR
         msg = self.format(record)
-        self.log_widget.addItem(msg)
-        item = self.log_widget.item(self.log_widget.count() - 1)
-        item.setForeground(Qt.GlobalColor.red if 'ERROR' in msg else Qt.GlobalColor.black)
+        self._pending.append((msg, is_error))
+        if threading.current_thread() is threading.main_thread():
+            if not self._timer.isActive():
+                self._timer.start()
+        else:
+            QMetaObject.invokeMethod(self._timer, "start", Qt.ConnectionType.QueuedConnection)
+        
+    def _flush(self):
+        """Add all buffered records to the log widget at once"""
+        records = []
+        while self._pending:
+            records.append(self._pending.popleft())
+        if not records:
+            return
+        first_row = self.log_widget.count()
+        self.log_widget.addItems([msg for msg, _ in records])
+        for offset, (_, is_error) in enumerate(records):
+            item = self.log_widget.item(first_row + offset)
+            item.setForeground(Qt.GlobalColor.red if is_error else Qt.GlobalColor.black)
         self.log_widget.scrollToBottom()
 
 class LoadingDialog(QDialog):
@@ -45,8 +342,7 @@ class LoadingDialog(QDialog):
         self.move(screen.center() - self.rect().center())
         
         # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout = _vbox(self, margins=(20, 20, 20, 20))
         
         # Add loading text
         self.status_label = QLabel("Initializing...")
@@ -59,32 +355,27 @@ class LoadingDialog(QDialog):
         self.progress.setRange(0, 0)  # Indeterminate progress
         layout.addWidget(self.progress)
         
-    def set_status(self, text: str):
-        """Update the status text"""
+    def set_status(self, text: str, flush: bool = False):
+        """Update the status text. Normally only the dialog is repainted; flush also
+        lets other pending non-input events through, which the first show needs"""
         self.status_label.setText(text)
-        QApplication.processEvents()  # Force UI update
+        if flush:
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        else:
+            self.status_label.repaint()
+            self.progress.repaint()
 
 class EntityToolGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Create event filter for spinboxes and comboboxes
-        class WheelEventFilter(QObject):
-            def eventFilter(self, obj, event):
-                if event.type() == QEvent.Type.Wheel:
-                        return True  # Block wheel events when widget doesn't have focus
-                return False  # Let other events pass through
-                
-        self.wheel_filter = WheelEventFilter()
-        
         # Show loading screen
         self.loading = LoadingDialog(self)
         self.loading.show()
-        QApplication.processEvents()  # Ensure loading screen is displayed
         
         try:
             # Initialize variables
-            self.loading.set_status("Initializing variables...")
+            self.loading.set_status("Initializing variables...", flush=True)  # Ensure loading screen is displayed
             self.current_folder = None
             self.base_game_folder = None
             self.current_file = None
@@ -97,10 +388,40 @@ class EntityToolGUI(QMainWindow):
                 'mod': {},      # {manifest_type: {id: data}}
                 'base_game': {} # {manifest_type: {id: data}}
             }
-            self.texture_cache = {}
+            self._manifest_signals = None  # Signals of the background manifest load in flight
+            # Config writes run one at a time off the GUI thread, so they land in order
+            self._config_pool = QThreadPool(self)
+            self._config_pool.setMaxThreadCount(1)
+            self.texture_cache = LRUCache(maxsize=256)  # {(folder, name): (pixmap, is_base_game)}
+            self.texture_preview_cache = LRUCache(maxsize=256)  # {(folder, name): pixmap scaled for the texture selector}
+            # Shared styling for base game rows, so populating a list does not allocate one per item
+            self._base_game_brush = QBrush(QColor(150, 150, 150))
+            self._base_game_font = QFont()
+            self._base_game_font.setItalic(True)
+            self._file_cache = LRUCache(maxsize=512)  # {(path, mtime_ns): raw file bytes}
+            self._file_index = {}  # {manifest_type: (mod ids, base game only ids)}, see get_file_index
+            self._localized_merged = {}  # {language: {key: (text, source)}}, see get_merged_localized_strings
+            self._localized_search_index = {}  # {language: [(key, display text, key lower, text lower, is_base_game)]}
+            self._folder_files = {}  # {(folder, suffix, recursive): ({directory: mtime_ns}, frozenset of paths)}, see list_folder_files
+            self._sound_files_cache = None  # (mod paths, base paths, result of get_sound_files)
+            # Selector dialogs are built on first use; each of these reopens its dialog for a new target
+            self._file_selector = None
+            self._uniforms_selector = None
+            self._localized_text_selector = None
+            # {(file path, tuple(path)): value} looked up in the command stack, valid for one data generation
+            self._command_value_cache = {}
+            self._command_value_generation = None
+            self._sorted_properties_cache = LRUCache(maxsize=1024)  # {property names: sorted property names}
+            self._resolved_schema_cache = LRUCache(maxsize=4096)  # {(id(schema), id(current_schema)): (schema, current_schema, resolved)}
             self.schemas = {}
             self.schema_extensions = set()
-            self.all_texture_files = {'mod': set(), 'base_game': set()}
+            self.schema_files = {}  # {'unit-schema': (path, stamp)}
+            self._schema_texts = {}  # {'unit-schema': JSON text}, until the schema is parsed by _get_schema
+            self.schemas_by_ext = {}  # {'.unit': 'unit-schema'}
+            self.schema_ext_by_name = {}  # {'unit-schema': '.unit'}
+            self.all_texture_files = {'mod': {}, 'base_game': {}}
+            self.texture_sources = []  # [(textures folder, source, is_base_game)], mod first
+            self.texture_search_entries = {'mod': [], 'base_game': []}  # sorted [(name, lower-cased name)]
             self.all_localized_strings = {
                 'mod': {},
                 'base_game': {}
@@ -119,13 +440,6 @@ class EntityToolGUI(QMainWindow):
             self.loading.set_status("Setting up logging...")
             self.setup_logging()
             
-            # Setup timers
-            self.text_edit_timer = QTimer()
-            self.text_edit_timer.setInterval(300)
-            self.text_edit_timer.setSingleShot(True)
-            self.text_edit_timer.timeout.connect(self.on_text_edit_timer_timeout)
-            self.current_text_edit = None
-            
             # Initialize command stack
             self.loading.set_status("Initializing command system...")
             self.command_stack = CommandStack()
@@ -133,11 +447,11 @@ class EntityToolGUI(QMainWindow):
             # Load or create config
             self.loading.set_status("Loading configuration...")
             try:
-                with open('config.json', 'r') as f:
-                    self.config = json.load(f)
-                    if "base_game_folder" in self.config:
-                        self.base_game_folder = Path(self.config["base_game_folder"])
-                        print(f"Loaded base game folder from config: {self.base_game_folder}")
+                # Copy the cached dict since the settings dialog modifies self.config
+                self.config = dict(_load_config_json('config.json', os.path.getmtime('config.json')))
+                if "base_game_folder" in self.config:
+                    self.base_game_folder = Path(self.config["base_game_folder"])
+                    print(f"Loaded base game folder from config: {self.base_game_folder}")
             except FileNotFoundError:
                 logging.info("No config.json found, creating default")
                 self.create_default_config()
@@ -146,17 +460,9 @@ class EntityToolGUI(QMainWindow):
                 self.create_default_config()
             
             # Load schemas
-            self.loading.set_status("Loading schemas...")
+            self.loading.set_status("Loading schemas...", flush=True)
             self.load_schemas()
             
-            # Load base game manifest files
-            self.loading.set_status("Loading base game manifests...")
-            self.load_base_game_manifest_files()
-            
-            # Apply stylesheet
-            self.loading.set_status("Applying visual styles...")
-            self.load_stylesheet()
-            
             # Setup shortcuts
             self.loading.set_status("Setting up shortcuts...")
             self.setup_shortcuts()
@@ -164,6 +470,13 @@ class EntityToolGUI(QMainWindow):
             # Show window
             self.showMaximized()
             
+            # Base game manifests are read in the background while the window opens
+            self.start_base_game_manifest_loader()
+            
+            # Apply stylesheet once the event loop is running, so the window is not
+            # re-polished while it is still being set up
+            QTimer.singleShot(0, self.load_stylesheet)
+            
             # Close loading screen
             self.loading.close()
             self.loading = None
@@ -200,6 +513,8 @@ class EntityToolGUI(QMainWindow):
 
     def init_ui(self):
         self.setWindowTitle('Sins 2 Entity Tool')
+        # Hold off repaints until the whole widget tree is in place
+        self.setUpdatesEnabled(False)
         
         # Create central widget and layout
         central_widget = QWidget()
@@ -216,51 +531,24 @@ class EntityToolGUI(QMainWindow):
         left_toolbar_layout = QHBoxLayout(left_toolbar)
         left_toolbar_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Folder button with icon
-        folder_btn = QPushButton()
-        folder_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "folder.png")))
-        folder_btn.setToolTip('Open Mod Folder')
-        folder_btn.setFixedSize(32, 32)
-        folder_btn.clicked.connect(self.open_folder_dialog)
-        left_toolbar_layout.addWidget(folder_btn)
-        
-        # Settings button with icon
-        settings_btn = QPushButton()
-        settings_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "settings.png")))
-        settings_btn.setToolTip('Settings')
-        settings_btn.setFixedSize(32, 32)
-        settings_btn.clicked.connect(self.show_settings_dialog)
-        left_toolbar_layout.addWidget(settings_btn)
-        
-        # Save button with icon
-        save_btn = QPushButton()
-        save_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "save.png")))
-        save_btn.setToolTip('Save Changes')
-        save_btn.setFixedSize(32, 32)
-        save_btn.clicked.connect(self.save_changes)
-        save_btn.setEnabled(False)  # Initially disabled
-        self.save_btn = save_btn  # Store reference
-        left_toolbar_layout.addWidget(save_btn)
-        
-        # Undo button with icon
-        undo_btn = QPushButton()
-        undo_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "undo.png")))
-        undo_btn.setToolTip('Undo (Ctrl+Z)')
-        undo_btn.setFixedSize(32, 32)
-        undo_btn.clicked.connect(self.undo)
-        undo_btn.setEnabled(False)  # Initially disabled
-        self.undo_btn = undo_btn  # Store reference
-        left_toolbar_layout.addWidget(undo_btn)
-        
-        # Redo button with icon
-        redo_btn = QPushButton()
-        redo_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "redo.png")))
-        redo_btn.setToolTip('Redo (Ctrl+Y)')
-        redo_btn.setFixedSize(32, 32)
-        redo_btn.clicked.connect(self.redo)
-        redo_btn.setEnabled(False)  # Initially disabled
-        self.redo_btn = redo_btn  # Store reference
-        left_toolbar_layout.addWidget(redo_btn)
+        # Toolbar buttons: (icon, tooltip, slot, attribute to store it under, initially enabled)
+        button_specs = [
+            ("folder.png", 'Open Mod Folder', self.open_folder_dialog, None, True),
+            ("settings.png", 'Settings', self.show_settings_dialog, None, True),
+            ("save.png", 'Save Changes', self.save_changes, 'save_btn', False),
+            ("undo.png", 'Undo (Ctrl+Z)', self.undo, 'undo_btn', False),
+            ("redo.png", 'Redo (Ctrl+Y)', self.redo, 'redo_btn', False),
+        ]
+        for icon_name, tooltip, slot, attr, enabled in button_specs:
+            btn = QPushButton()
+            btn.setIcon(_icon(icon_name))
+            btn.setToolTip(tooltip)
+            btn.setFixedSize(32, 32)
+            btn.clicked.connect(slot)
+            btn.setEnabled(enabled)
+            if attr:
+                setattr(self, attr, btn)  # Store reference
+            left_toolbar_layout.addWidget(btn)
         
         toolbar_layout.addWidget(left_toolbar)
         toolbar_layout.addStretch()
@@ -278,7 +566,7 @@ class EntityToolGUI(QMainWindow):
 
         # Add/Delete Player button
         add_player_btn = QPushButton()
-        add_player_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "add_delete.png")))
+        add_player_btn.setIcon(_icon("add_delete.png"))
         add_player_btn.setToolTip('Add/Delete Player')
         add_player_btn.setFixedSize(20, 20)
         add_player_btn.clicked.connect(self.show_add_player_dialog)
@@ -288,16 +576,67 @@ class EntityToolGUI(QMainWindow):
         
         # Tab widget for different sections
         self.tab_widget = QTabWidget()
+
+        # Only the visible tab is built at startup, the others are built the
+        # first time they are shown or when a mod folder is loaded
+        self._tab_builders = {}
+        self._add_lazy_tab("Player", self._build_player_tab)
+        self._add_lazy_tab("Units", self._build_units_tab)
+        self._add_lazy_tab("Unit Items", self._build_unit_items_tab)
+        self._add_lazy_tab("Abilities/Buffs", self._build_abilities_tab)
+        self._add_lazy_tab("Research", self._build_research_tab)
+        self._add_lazy_tab("Formations/Flight Patterns", self._build_formations_tab)
+        self._add_lazy_tab("NPC Rewards", self._build_rewards_tab)
+        self._add_lazy_tab("Exotics", self._build_exotics_tab)
+        self._add_lazy_tab("Uniforms", self._build_uniforms_tab)
+        self._add_lazy_tab("Mod Meta Data", self._build_meta_tab)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+
+        main_layout.addWidget(self.tab_widget)
         
-        # Player Tab
+        # Enable drag and drop
+        self.setAcceptDrops(True)
+        
+        self.setUpdatesEnabled(True)
+        self.update()
+            
+    def _add_lazy_tab(self, title: str, builder):
+        """Add a placeholder tab whose contents are created by builder on first use"""
+        placeholder = QWidget()
+        layout = _vbox(placeholder)
+        index = self.tab_widget.addTab(placeholder, title)
+        self._tab_builders[index] = builder
+
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index: int):
+        """Build a tab's contents if they have not been created yet"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+
+    def _build_all_tabs(self):
+        """Build every tab that is still a placeholder"""
+        if not self._tab_builders:
+            return
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for index in list(self._tab_builders):
+                self._ensure_tab_built(index)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def _build_player_tab(self) -> QWidget:
+        """Create the Player tab"""
         player_widget = QScrollArea()
         player_widget.setWidgetResizable(True)
         player_content = QWidget()
         self.player_layout = QVBoxLayout(player_content)
         player_widget.setWidget(player_content)
-        self.tab_widget.addTab(player_widget, "Player")
-        
-        # Units Tab
+        return player_widget
+
+    def _build_units_tab(self) -> QWidget:
+        """Create the Units tab"""
         units_widget = QScrollArea()
         units_widget.setWidgetResizable(True)
         units_content = QWidget()
@@ -310,13 +649,12 @@ class EntityToolGUI(QMainWindow):
         
         # Left side - Lists
         lists_widget = QWidget()
-        lists_layout = QVBoxLayout(lists_widget)
-        lists_layout.setContentsMargins(0, 0, 0, 0)
+        lists_layout = _vbox(lists_widget)
         
         # Buildable Units
         units_list_group = QGroupBox("Buildable Units")
         units_list_layout = QVBoxLayout()
-        self.units_list = QListWidget()
+        self.units_list = _batched_list(QListWidget())
         self.units_list.itemClicked.connect(self.on_unit_selected)
         self.setup_list_context_menu(self.units_list, "unit")
         units_list_layout.addWidget(self.units_list)
@@ -326,7 +664,7 @@ class EntityToolGUI(QMainWindow):
         # Strikecraft
         strikecraft_list_group = QGroupBox("Buildable Strikecraft")
         strikecraft_list_layout = QVBoxLayout()
-        self.strikecraft_list = QListWidget()
+        self.strikecraft_list = _batched_list(QListWidget())
         self.strikecraft_list.itemClicked.connect(self.on_unit_selected)
         self.setup_list_context_menu(self.strikecraft_list, "unit")
         strikecraft_list_layout.addWidget(self.strikecraft_list)
@@ -336,8 +674,10 @@ class EntityToolGUI(QMainWindow):
         # All Units
         all_units_group = QGroupBox("All Units")
         all_units_layout = QVBoxLayout()
-        self.all_units_list = QListWidget()
-        self.all_units_list.itemClicked.connect(self.on_unit_selected)
+        self.all_units_model = EntityListModel(self)
+        self.all_units_list = _batched_list(QListView())
+        self.all_units_list.setModel(self.all_units_model)
+        self.all_units_list.clicked.connect(self.on_unit_selected)
         self.setup_list_context_menu(self.all_units_list, "unit")
         all_units_layout.addWidget(self.all_units_list)
         all_units_group.setLayout(all_units_layout)
@@ -360,9 +700,7 @@ class EntityToolGUI(QMainWindow):
         
         # Right side vertical split for skin and weapon
         right_side = QWidget()
-        right_layout = QVBoxLayout(right_side)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(10)  # Add some spacing between panels
+        right_layout = _vbox(right_side, spacing=10)  # Add some spacing between panels
         
         # Unit Skin panel
         skin_details_group = QGroupBox("Unit Skin")
@@ -394,40 +732,49 @@ class EntityToolGUI(QMainWindow):
         # Add the split layout to the units tab
         self.units_layout.addWidget(units_split)
         units_widget.setWidget(units_content)
-        self.tab_widget.addTab(units_widget, "Units")
-
-        # Unit Items Tab
-        unit_items_widget = QScrollArea()
-        unit_items_widget.setWidgetResizable(True)
-        unit_items_content = QWidget()
-        unit_items_layout = QVBoxLayout(unit_items_content)
-        
-        # Create split layout for unit items tab
-        unit_items_split = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Left side - Items list
-        items_list_group = QGroupBox("Unit Items")
-        items_list_layout = QVBoxLayout()
-        self.items_list = QListWidget()
-        self.items_list.itemClicked.connect(self.on_item_selected)
-        self.setup_list_context_menu(self.items_list, "unit_item")
-        items_list_layout.addWidget(self.items_list)
-        items_list_group.setLayout(items_list_layout)
-        unit_items_split.addWidget(items_list_group)
-        
-        # Right side - Item details
-        item_details_group = QGroupBox("Item Details")
-        self.item_details_layout = QVBoxLayout(item_details_group)
-        unit_items_split.addWidget(item_details_group)
+        return units_widget
+
+    def _build_list_detail_tab(self, list_title: str, list_widget, file_type: str,
+                               details_title: str, details_layout_attr: str) -> QWidget:
+        """Create a tab with an entity list on the left and a details panel on the right"""
+        tab_widget = QScrollArea()
+        tab_widget.setWidgetResizable(True)
+        tab_content = QWidget()
+        tab_layout = QVBoxLayout(tab_content)
+        
+        split = QSplitter(Qt.Orientation.Horizontal)
+        
+        # Left side - list
+        list_group = QGroupBox(list_title)
+        list_layout = QVBoxLayout()
+        self.setup_list_context_menu(list_widget, file_type)
+        list_layout.addWidget(list_widget)
+        list_group.setLayout(list_layout)
+        split.addWidget(list_group)
+        
+        # Right side - details
+        details_group = QGroupBox(details_title)
+        setattr(self, details_layout_attr, QVBoxLayout(details_group))
+        split.addWidget(details_group)
         
         # Set initial sizes (1:4 ratio)
-        unit_items_split.setSizes([100, 400])
-        
-        unit_items_layout.addWidget(unit_items_split)
-        unit_items_widget.setWidget(unit_items_content)
-        self.tab_widget.addTab(unit_items_widget, "Unit Items")
-
-        # Abilities/Buffs Tab
+        split.setSizes([100, 400])
+        
+        tab_layout.addWidget(split)
+        tab_widget.setWidget(tab_content)
+        return tab_widget
+
+    def _build_unit_items_tab(self) -> QWidget:
+        """Create the Unit Items tab"""
+        self.items_model = EntityListModel(self)
+        self.items_list = _batched_list(QListView())
+        self.items_list.setModel(self.items_model)
+        self.items_list.clicked.connect(self.on_item_selected)
+        return self._build_list_detail_tab("Unit Items", self.items_list, "unit_item",
+                                           "Item Details", "item_details_layout")
+
+    def _build_abilities_tab(self) -> QWidget:
+        """Create the Abilities/Buffs tab"""
         abilities_widget = QScrollArea()
         abilities_widget.setWidgetResizable(True)
         abilities_content = QWidget()
@@ -442,7 +789,7 @@ class EntityToolGUI(QMainWindow):
         # Ability selection
         ability_group = QGroupBox("Abilities")
         ability_layout = QVBoxLayout()
-        self.ability_list = QListWidget()
+        self.ability_list = _batched_list(QListWidget())
         self.ability_list.itemClicked.connect(self.on_ability_selected)
         self.setup_list_context_menu(self.ability_list, "ability")
         ability_layout.addWidget(self.ability_list)
@@ -452,7 +799,7 @@ class EntityToolGUI(QMainWindow):
         # Action Data Source selection
         action_group = QGroupBox("Action Data Sources")
         action_layout = QVBoxLayout()
-        self.action_list = QListWidget()
+        self.action_list = _batched_list(QListWidget())
         self.action_list.itemClicked.connect(self.on_action_selected)
         self.setup_list_context_menu(self.action_list, "action_data_source")
         action_layout.addWidget(self.action_list)
@@ -462,7 +809,7 @@ class EntityToolGUI(QMainWindow):
         # Buff selection
         buff_group = QGroupBox("Buffs")
         buff_layout = QVBoxLayout()
-        self.buff_list = QListWidget()
+        self.buff_list = _batched_list(QListWidget())
         self.buff_list.itemClicked.connect(self.on_buff_selected)
         self.setup_list_context_menu(self.buff_list, "buff")
         buff_layout.addWidget(self.buff_list)
@@ -473,9 +820,7 @@ class EntityToolGUI(QMainWindow):
         
         # Right side - Schema views
         right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(10)  # Add some spacing between panels
+        right_layout = _vbox(right_panel, spacing=10)  # Add some spacing between panels
         
         # Ability details
         ability_details_group = QGroupBox("Ability Details")
@@ -502,17 +847,19 @@ class EntityToolGUI(QMainWindow):
         
         abilities_layout.addWidget(abilities_split)
         abilities_widget.setWidget(abilities_content)
-        self.tab_widget.addTab(abilities_widget, "Abilities/Buffs")
+        return abilities_widget
 
-        # Research Tab (existing)
+    def _build_research_tab(self) -> QWidget:
+        """Create the Research tab"""
         research_widget = QScrollArea()
         research_widget.setWidgetResizable(True)
         research_content = QWidget()
         self.research_layout = QVBoxLayout(research_content)
         research_widget.setWidget(research_content)
-        self.tab_widget.addTab(research_widget, "Research")
+        return research_widget
 
-        # Formations/Flight Patterns Tab
+    def _build_formations_tab(self) -> QWidget:
+        """Create the Formations/Flight Patterns tab"""
         formations_widget = QScrollArea()
         formations_widget.setWidgetResizable(True)
         formations_content = QWidget()
@@ -527,7 +874,7 @@ class EntityToolGUI(QMainWindow):
         # Formations selection
         formations_group = QGroupBox("Formations")
         formations_list_layout = QVBoxLayout()
-        self.formations_list = QListWidget()
+        self.formations_list = _batched_list(QListWidget())
         self.formations_list.itemClicked.connect(self.on_formation_selected)
         self.setup_list_context_menu(self.formations_list, "formation")
         formations_list_layout.addWidget(self.formations_list)
@@ -537,7 +884,7 @@ class EntityToolGUI(QMainWindow):
         # Flight Patterns selection
         patterns_group = QGroupBox("Flight Patterns")
         patterns_list_layout = QVBoxLayout()
-        self.patterns_list = QListWidget()
+        self.patterns_list = _batched_list(QListWidget())
         self.patterns_list.itemClicked.connect(self.on_pattern_selected)
         self.setup_list_context_menu(self.patterns_list, "flight_pattern")
         patterns_list_layout.addWidget(self.patterns_list)
@@ -548,9 +895,7 @@ class EntityToolGUI(QMainWindow):
         
         # Right side - Schema views
         formations_right = QWidget()
-        formations_right_layout = QVBoxLayout(formations_right)
-        formations_right_layout.setContentsMargins(0, 0, 0, 0)
-        formations_right_layout.setSpacing(10)  # Add spacing between panels
+        formations_right_layout = _vbox(formations_right, spacing=10)  # Add spacing between panels
         
         # Formation details
         formation_details_group = QGroupBox("Formation Details")
@@ -571,111 +916,38 @@ class EntityToolGUI(QMainWindow):
         
         formations_layout.addWidget(formations_split)
         formations_widget.setWidget(formations_content)
-        self.tab_widget.addTab(formations_widget, "Formations/Flight Patterns")
+        return formations_widget
 
-        # NPC Rewards Tab
-        rewards_widget = QScrollArea()
-        rewards_widget.setWidgetResizable(True)
-        rewards_content = QWidget()
-        rewards_layout = QVBoxLayout(rewards_content)
-        
-        rewards_split = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Left side - Rewards list
-        rewards_list_group = QGroupBox("NPC Rewards")
-        rewards_list_layout = QVBoxLayout()
-        self.rewards_list = QListWidget()
+    def _build_rewards_tab(self) -> QWidget:
+        """Create the NPC Rewards tab"""
+        self.rewards_list = _batched_list(QListWidget())
         self.rewards_list.itemClicked.connect(self.on_reward_selected)
-        self.setup_list_context_menu(self.rewards_list, "npc_reward")
-        rewards_list_layout.addWidget(self.rewards_list)
-        rewards_list_group.setLayout(rewards_list_layout)
-        rewards_split.addWidget(rewards_list_group)
-        
-        # Right side - Reward details
-        reward_details_group = QGroupBox("Reward Details")
-        self.reward_details_layout = QVBoxLayout(reward_details_group)
-        rewards_split.addWidget(reward_details_group)
-        
-        # Set initial sizes (1:4 ratio)
-        rewards_split.setSizes([100, 400])
-        
-        rewards_layout.addWidget(rewards_split)
-        rewards_widget.setWidget(rewards_content)
-        self.tab_widget.addTab(rewards_widget, "NPC Rewards")
+        return self._build_list_detail_tab("NPC Rewards", self.rewards_list, "npc_reward",
+                                           "Reward Details", "reward_details_layout")
 
-        # Exotics Tab
-        exotics_widget = QScrollArea()
-        exotics_widget.setWidgetResizable(True)
-        exotics_content = QWidget()
-        exotics_layout = QVBoxLayout(exotics_content)
-        
-        exotics_split = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Left side - Exotics list
-        exotics_list_group = QGroupBox("Exotics")
-        exotics_list_layout = QVBoxLayout()
-        self.exotics_list = QListWidget()
+    def _build_exotics_tab(self) -> QWidget:
+        """Create the Exotics tab"""
+        self.exotics_list = _batched_list(QListWidget())
         self.exotics_list.itemClicked.connect(self.on_exotic_selected)
-        self.setup_list_context_menu(self.exotics_list, "exotic")
-        exotics_list_layout.addWidget(self.exotics_list)
-        exotics_list_group.setLayout(exotics_list_layout)
-        exotics_split.addWidget(exotics_list_group)
-        
-        # Right side - Exotic details
-        exotic_details_group = QGroupBox("Exotic Details")
-        self.exotic_details_layout = QVBoxLayout(exotic_details_group)
-        exotics_split.addWidget(exotic_details_group)
-        
-        # Set initial sizes (1:4 ratio)
-        exotics_split.setSizes([100, 400])
-        
-        exotics_layout.addWidget(exotics_split)
-        exotics_widget.setWidget(exotics_content)
-        self.tab_widget.addTab(exotics_widget, "Exotics")
+        return self._build_list_detail_tab("Exotics", self.exotics_list, "exotic",
+                                           "Exotic Details", "exotic_details_layout")
 
-        # Uniforms Tab
-        uniforms_widget = QScrollArea()
-        uniforms_widget.setWidgetResizable(True)
-        uniforms_content = QWidget()
-        uniforms_layout = QVBoxLayout(uniforms_content)
-        
-        uniforms_split = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Left side - Uniforms list
-        uniforms_list_group = QGroupBox("Uniforms")
-        uniforms_list_layout = QVBoxLayout()
-        self.uniforms_list = QListWidget()
+    def _build_uniforms_tab(self) -> QWidget:
+        """Create the Uniforms tab"""
+        self.uniforms_list = _batched_list(QListWidget())
         self.uniforms_list.itemClicked.connect(self.on_uniform_selected)
-        self.setup_list_context_menu(self.uniforms_list, "uniform")
-        uniforms_list_layout.addWidget(self.uniforms_list)
-        uniforms_list_group.setLayout(uniforms_list_layout)
-        uniforms_split.addWidget(uniforms_list_group)
-        
-        # Right side - Uniform details
-        uniform_details_group = QGroupBox("Uniform Details")
-        self.uniform_details_layout = QVBoxLayout(uniform_details_group)
-        uniforms_split.addWidget(uniform_details_group)
-        
-        # Set initial sizes (1:4 ratio)
-        uniforms_split.setSizes([100, 400])
-        
-        uniforms_layout.addWidget(uniforms_split)
-        uniforms_widget.setWidget(uniforms_content)
-        self.tab_widget.addTab(uniforms_widget, "Uniforms")
+        return self._build_list_detail_tab("Uniforms", self.uniforms_list, "uniform",
+                                           "Uniform Details", "uniform_details_layout")
 
-        # Mod Meta Data Tab
+    def _build_meta_tab(self) -> QWidget:
+        """Create the Mod Meta Data tab"""
         meta_widget = QScrollArea()
         meta_widget.setWidgetResizable(True)
         meta_content = QWidget()
         self.meta_layout = QVBoxLayout(meta_content)
         meta_widget.setWidget(meta_content)
-        self.tab_widget.addTab(meta_widget, "Mod Meta Data")
-        
-        main_layout.addWidget(self.tab_widget)
-        
-        # Enable drag and drop
-        self.setAcceptDrops(True)
-            
+        return meta_widget
+
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
         # Save shortcut (Ctrl+S)
@@ -693,21 +965,18 @@ class EntityToolGUI(QMainWindow):
     def load_stylesheet(self):
         """Load and apply the dark theme stylesheet from QSS file"""
         try:
-            style_path = Path(__file__).parent / "style.qss"
-            if not style_path.exists():
+            if not _STYLE_PATH.exists():
                 logging.error("Style file not found")
                 return
                 
-            with open(style_path, 'r') as f:
-                style = f.read()
-                
+            style = _load_qss(str(_STYLE_PATH), _STYLE_PATH.stat().st_mtime)
             self.setStyleSheet(style)
             logging.info("Loaded stylesheet")
         except Exception as e:
             print(f"Error loading stylesheet: {str(e)}")
     
     def load_schemas(self):
-        """Load schema files from the schema folder"""
+        """Find schema files in the schema folder; full schemas are parsed on first use"""
         schema_folder = self.config.get("schema_folder")
         if not schema_folder:
             logging.warning("No schema folder configured")
@@ -722,163 +991,207 @@ class EntityToolGUI(QMainWindow):
             # Clear existing extensions and schemas
             self.schema_extensions = set()
             self.schemas = {}
+            self.schema_files = {}
+            self.schemas_by_ext = {}
+            self.schema_ext_by_name = {}
+            self._schema_texts = {}  # {schema name: JSON text}, until the schema is parsed by _get_schema
             
             # Process each schema file
             schema_files = list(schema_path.glob("*-schema.json"))  # Changed pattern to match actual filenames
             print(f"Found {len(schema_files)} schema files")
             
-            for file_path in schema_files:
+            # Unchanged files are taken from the on-disk cache of the last run
+            disk_cache = _read_schema_cache()
+            
+            def read_summary(file_path):
+                """Return ((stamp, fileExtension, JSON text), from cache, error) for a schema file"""
+                try:
+                    st = file_path.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    cached = disk_cache.get(str(file_path))
+                    if cached and cached[0] == stamp:
+                        return cached, True, None
+                    # Only the extension is needed now, the schema is parsed when first used
+                    raw = file_path.read_bytes()
+                    match = _FILE_EXTENSION_RE.search(raw)
+                    ext = json.loads(b'"' + match.group(1) + b'"') if match else None
+                    return (stamp, ext, raw.decode('utf-8')), False, None
+                except Exception as e:
+                    return None, False, e
+            
+            # Files are read in parallel; map keeps results in file order, which
+            # resolve_schema_references relies on when searching every schema
+            results = []
+            if schema_files:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(schema_files))) as pool:
+                    results = list(pool.map(read_summary, schema_files))
+            
+            cache = {}  # Entries for the on-disk cache, see _write_schema_cache
+            cache_hits = 0
+            for file_path, (entry, from_cache, error) in zip(schema_files, results):
                 try:
-                    with open(file_path, encoding='utf-8') as f:
-                        schema = json.load(f)
+                    if error:
+                        raise error
+                    stamp, ext, text = entry
+                    cache[str(file_path)] = entry
+                    cache_hits += from_cache
                         
                     # Get schema name from filename (e.g. "unit-schema.json" -> "unit-schema")
                     schema_name = file_path.stem  # This will be e.g. "unit-schema"
-                    self.schemas[schema_name] = schema
+                    self.schema_files[schema_name] = (file_path, stamp)
+                    self._schema_texts[schema_name] = text
                     
                     # Add file extension if specified in schema
-                    if 'fileExtension' in schema:
-                        print(f"Adding schema extension: {schema['fileExtension']}")
-                        ext = schema['fileExtension']
+                    if ext:
+                        print(f"Adding schema extension: {ext}")
                         if not ext.startswith('.'):
                             ext = '.' + ext
                         self.schema_extensions.add(ext)
+                        self.schemas_by_ext[ext] = schema_name
+                        self.schema_ext_by_name[schema_name] = ext
                         
-                    print(f"Loaded schema: {schema_name}")
+                    print(f"Found schema: {schema_name}")
                 except Exception as e:
                     print(f"Error loading schema {file_path}: {str(e)}")
             
-            print(f"Successfully loaded {len(self.schemas)} schemas")
+            print(f"Successfully found {len(self.schema_files)} schemas ({cache_hits} from cache)")
+            
+            # Store new and changed files, and drop entries for files that no longer exist
+            if cache_hits != len(cache) or cache.keys() != disk_cache.keys():
+                _write_schema_cache(cache)
             
         except Exception as e:
             print(f"Error loading schemas: {str(e)}")
     
+    def _get_schema(self, schema_name: str):
+        """Return the parsed schema for schema_name, parsing it on first use. None if unknown"""
+        schema = self.schemas.get(schema_name)
+        if schema is None and schema_name in self._schema_texts:
+            file_path, _ = self.schema_files[schema_name]
+            try:
+                schema = _loads(self._schema_texts.pop(schema_name))
+            except Exception as e:
+                print(f"Error loading schema {file_path}: {str(e)}")
+                return None
+            print(f"Loaded schema: {schema_name}")
+            self.schemas[schema_name] = schema
+        return schema
+    
+    def run_in_background(self, *loaders) -> list:
+        """Run loaders on worker threads and wait for all of them, keeping the event loop
+        spinning (without user input) meanwhile. Events can run against the window's state,
+        so loaders must not modify it; they return their results instead, in loader order.
+        The first loader error is re-raised"""
+        futures = [_FOLDER_LOAD_POOL.submit(loader) for loader in loaders]
+        pending = set(futures)
+        while pending:
+            _, pending = concurrent.futures.wait(pending, timeout=0.05)
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        return [future.result() for future in futures]
+
     def load_folder(self, folder_path: Path):
         """Load all files from the mod folder"""
         # Show loading screen
         loading = LoadingDialog(self)
         loading.setWindowTitle("Loading Mod Folder")
         loading.show()
-        QApplication.processEvents()
         
         try:
-            loading.set_status("Initializing...")
+            loading.set_status("Initializing...", flush=True)
+            # Every list gets populated below, so the tabs holding them must exist
+            self._build_all_tabs()
+            self.wait_for_base_game_manifests()
             self.current_folder = folder_path.resolve()  # Get absolute path
             self.files_by_type.clear()
+            self._file_cache.clear()
             self.manifest_files.clear()
             self.player_selector.clear()
             
-            # Load all data into memory
-            loading.set_status("Loading localized strings...")
-            self.load_all_localized_strings()
-            
-            loading.set_status("Loading texture files...")
-            self.load_all_texture_files()
-            
-            loading.set_status("Loading manifest files...")
-            self.load_mod_manifest_files()
-            
-            # Clear all lists
-            loading.set_status("Preparing interface...")
-            self.items_list.clear()
-            self.ability_list.clear()
-            self.action_list.clear()
-            self.buff_list.clear()
-            self.formations_list.clear()
-            self.patterns_list.clear()
-            self.rewards_list.clear()
-            self.exotics_list.clear()
-            self.uniforms_list.clear()
+            # Load all data into memory. The files are read concurrently while the loading
+            # dialog keeps repainting, then the results are installed here on the GUI thread
+            loading.set_status("Loading localized strings, textures and manifests...")
+            for install in self.run_in_background(self.read_all_localized_strings,
+                                                   self.read_all_texture_files,
+                                                   self.read_mod_manifest_files):
+                install()
             
             # Process all files recursively
             loading.set_status("Loading entities...")
             entities_folder = self.current_folder / "entities"
             base_entities_folder = None if not self.base_game_folder else self.base_game_folder / "entities"
             
-            def add_items_to_list(list_widget, pattern, folder, is_base_game=False):
-                """Add items to a list widget with optional base game styling"""
+            def scan_by_extension(folder):
+                """Group the file names in folder by extension with a single directory scan"""
+                names_by_ext = {}
                 if not folder or not folder.exists():
+                    return names_by_ext
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        stem, dot, ext = entry.name.rpartition('.')
+                        if dot and stem and not entry.name.startswith('.') and entry.is_file():
+                            names_by_ext.setdefault(ext.lower(), []).append(stem)
+                return names_by_ext
+            
+            def fill_list(list_widget, mod_names, base_names):
+                """Replace the contents of a list with mod names followed by styled base game names.
+                Base game names the mod overrides are left out, compared lower-cased as the game does on Windows"""
+                if mod_names and base_names:
+                    mod_stems = {name.lower() for name in mod_names}
+                    base_names = [name for name in base_names if name.lower() not in mod_stems]
+                model = list_widget.model()
+                if isinstance(model, EntityListModel):
+                    # Model-backed lists are refilled with a single model reset
+                    model.set_rows(mod_names, base_names)
                     return
-                for file in folder.glob(pattern):
-                    item = QListWidgetItem(file.stem)
-                    if is_base_game:
-                        item.setForeground(QColor(150, 150, 150))
-                        font = item.font()
-                        font.setItalic(True)
-                        item.setFont(font)
-                    list_widget.addItem(item)
-
+                list_widget.setUpdatesEnabled(False)
+                try:
+                    list_widget.clear()
+                    list_widget.addItems(mod_names)
+                    if base_names:
+                        # Insert all rows in one call, then style the new rows in place
+                        first_row = list_widget.count()
+                        list_widget.addItems(base_names)
+                        for row in range(first_row, list_widget.count()):
+                            item = list_widget.item(row)
+                            self.style_base_game_item(item)
+                finally:
+                    list_widget.setUpdatesEnabled(True)
+            
+            # Entity lists keyed by file extension, each filled from one scan per folder
+            lists_by_extension = {
+                'unit': self.all_units_list,
+                'unit_item': self.items_list,
+                'ability': self.ability_list,
+                'action_data_source': self.action_list,
+                'buff': self.buff_list,
+                'formation': self.formations_list,
+                'flight_pattern': self.patterns_list,
+                'npc_reward': self.rewards_list,
+                'exotic': self.exotics_list,
+            }
+            
             if entities_folder.exists():
-                loading.set_status("Loading units...")
-                # Load all units first
-                self.all_units_list.clear()
-                add_items_to_list(self.all_units_list, "*.unit", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.all_units_list, "*.unit", base_entities_folder, True)
-                
-                loading.set_status("Loading unit items...")
-                # Load unit items
-                add_items_to_list(self.items_list, "*.unit_item", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.items_list, "*.unit_item", base_entities_folder, True)
-                
-                loading.set_status("Loading abilities...")
-                # Load abilities
-                add_items_to_list(self.ability_list, "*.ability", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.ability_list, "*.ability", base_entities_folder, True)
-                
-                loading.set_status("Loading actions...")
-                # Load action data sources
-                add_items_to_list(self.action_list, "*.action_data_source", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.action_list, "*.action_data_source", base_entities_folder, True)
-                
-                loading.set_status("Loading buffs...")
-                # Load buffs
-                add_items_to_list(self.buff_list, "*.buff", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.buff_list, "*.buff", base_entities_folder, True)
-                
-                loading.set_status("Loading formations...")
-                # Load formations
-                add_items_to_list(self.formations_list, "*.formation", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.formations_list, "*.formation", base_entities_folder, True)
-                
-                loading.set_status("Loading flight patterns...")
-                # Load flight patterns
-                add_items_to_list(self.patterns_list, "*.flight_pattern", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.patterns_list, "*.flight_pattern", base_entities_folder, True)
-                
-                loading.set_status("Loading NPC rewards...")
-                # Load NPC rewards
-                add_items_to_list(self.rewards_list, "*.npc_reward", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.rewards_list, "*.npc_reward", base_entities_folder, True)
-                
-                loading.set_status("Loading exotics...")
-                # Load exotics
-                add_items_to_list(self.exotics_list, "*.exotic", entities_folder)
-                if base_entities_folder:
-                    add_items_to_list(self.exotics_list, "*.exotic", base_entities_folder, True)
+                mod_files = scan_by_extension(entities_folder)
+                base_files = scan_by_extension(base_entities_folder)
+            else:
+                mod_files = base_files = {}
+            for ext, list_widget in lists_by_extension.items():
+                fill_list(list_widget, mod_files.get(ext, []), base_files.get(ext, []))
 
             loading.set_status("Loading uniforms...")
             # Load uniforms from uniforms folder
             uniforms_folder = self.current_folder / "uniforms"
             base_uniforms_folder = None if not self.base_game_folder else self.base_game_folder / "uniforms"
-            add_items_to_list(self.uniforms_list, "*.uniforms", uniforms_folder)
-            if base_uniforms_folder and base_uniforms_folder.exists():
-                add_items_to_list(self.uniforms_list, "*.uniforms", base_uniforms_folder, True)
+            fill_list(self.uniforms_list,
+                      scan_by_extension(uniforms_folder).get('uniforms', []),
+                      scan_by_extension(base_uniforms_folder).get('uniforms', []))
             
             loading.set_status("Loading mod metadata...")
             # Load mod meta data if exists
             meta_file = self.current_folder / ".mod_meta_data"
             if meta_file.exists():
                 try:
-                    with open(meta_file, 'r', encoding='utf-8') as f:
-                        meta_data = json.load(f)
+                    meta_data = _load_json(meta_file)
                     self.clear_layout(self.meta_layout)
                     schema_view = self.create_schema_view("mod-meta-data", meta_data, False, meta_file)
                     self.meta_layout.addWidget(schema_view)
@@ -906,16 +1219,16 @@ class EntityToolGUI(QMainWindow):
         Returns tuple of (data, is_from_base_game)"""
         try:
             # Try mod folder first
-            if file_path.exists():
-                with open(file_path, encoding='utf-8') as f:
-                    return json.load(f), False
+            data = self.read_json_cached(file_path)
+            if data is not None:
+                return data, False
             
             # Try base game folder if enabled
             if try_base_game and self.config.get("base_game_folder"):
                 base_game_path = Path(self.config["base_game_folder"]) / file_path.relative_to(self.current_folder)
-                if base_game_path.exists():
-                    with open(base_game_path, encoding='utf-8') as f:
-                        return json.load(f), True
+                data = self.read_json_cached(base_game_path)
+                if data is not None:
+                    return data, True
             
             raise FileNotFoundError(f"File not found in mod or base game folder: {file_path}")
             
@@ -923,6 +1236,21 @@ class EntityToolGUI(QMainWindow):
             print(f"Error loading file {file_path}: {str(e)}")
             return None, False
          
+    def read_json_cached(self, path: Path):
+        """Parse a JSON file, reusing the bytes read last time while its modification time is unchanged.
+        Every call parses into new objects, so callers may modify the result freely.
+        Returns None if the file does not exist"""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        key = (path, mtime)
+        raw = self._file_cache.get(key)
+        if raw is None:
+            raw = path.read_bytes()
+            self._file_cache[key] = raw
+        return _loads(raw)
+         
     def load_texture(self, texture_name: str) -> tuple[QPixmap, bool]:
         """Load a texture from mod or base game folder.
         Returns tuple of (pixmap, is_from_base_game)"""
@@ -930,91 +1258,88 @@ class EntityToolGUI(QMainWindow):
             return QPixmap(), False
             
         # Check cache first
-        cache_key = f"{self.current_folder}:{texture_name}"
-        if cache_key in self.texture_cache:
-            return self.texture_cache[cache_key]
-            
-        # Try mod folder first
-        if texture_name in self.all_texture_files['mod']:
-            texture_path = self.current_folder / "textures" / f"{texture_name}.png"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, False)
-                    return pixmap, False
-                    
-            # Try DDS if PNG not found
-            texture_path = self.current_folder / "textures" / f"{texture_name}.dds"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, False)
-                    return pixmap, False
-        
-        # Try base game folder
-        if texture_name in self.all_texture_files['base_game']:
-            base_game_folder = self.config.get("base_game_folder")
-            if base_game_folder:
-                texture_path = Path(base_game_folder) / "textures" / f"{texture_name}.png"
-                if texture_path.exists():
-                    pixmap = QPixmap(str(texture_path))
-                    if not pixmap.isNull():
-                        self.texture_cache[cache_key] = (pixmap, True)
-                        return pixmap, True
-                        
-                # Try DDS if PNG not found
-                texture_path = Path(base_game_folder) / "textures" / f"{texture_name}.dds"
-            if texture_path.exists():
-                pixmap = QPixmap(str(texture_path))
-                if not pixmap.isNull():
-                    self.texture_cache[cache_key] = (pixmap, True)
-                    return pixmap, True
+        cache_key = (self.current_folder, texture_name)
+        cached = self.texture_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
+        # Mod folder first, then base game; the texture scan recorded which extension exists
+        for textures_folder, source, is_base_game in self.texture_sources:
+            suffix = self.all_texture_files[source].get(texture_name)
+            if not suffix:
+                continue
+            pixmap = QPixmap(str(textures_folder / (texture_name + suffix)))
+            if not pixmap.isNull():
+                return self.cache_texture(cache_key, pixmap, is_base_game)
         
         # Return empty pixmap if texture not found
         return QPixmap(), False
+
+    def cache_texture(self, cache_key: tuple, pixmap: QPixmap, is_base_game: bool) -> tuple[QPixmap, bool]:
+        """Store a loaded texture in the texture cache and return it with its origin"""
+        self.texture_cache[cache_key] = (pixmap, is_base_game)
+        return pixmap, is_base_game
  
     def load_base_game_manifest_files(self) -> None:
         """Load manifest files from base game into memory"""
         logging.info("Loading base game manifest files...")
-        
-        # Clear existing base game manifest data
-        self.manifest_data['base_game'] = {}
-        
-        if self.base_game_folder:
-            print(f"Using base game folder: {self.base_game_folder}")
-            entities_folder = self.base_game_folder / "entities"
-            if entities_folder.exists():
-                print(f"Found base game entities folder: {entities_folder}")
-                for manifest_file in entities_folder.glob("*.entity_manifest"):
-                    try:
-                        manifest_type = manifest_file.stem  # e.g., 'player', 'weapon'
-                        print(f"Loading base game manifest: {manifest_file}")
-                        with open(manifest_file, 'r', encoding='utf-8') as f:
-                            manifest_data = json.load(f)
-                            
-                        if manifest_type not in self.manifest_data['base_game']:
-                            self.manifest_data['base_game'][manifest_type] = {}
-                            
-                        # Load each referenced entity file
-                        if 'ids' in manifest_data:
-                            for entity_id in manifest_data['ids']:
-                                entity_file = entities_folder / f"{entity_id}.{manifest_type}"
-                                if entity_file.exists():
-                                    with open(entity_file, 'r', encoding='utf-8') as f:
-                                        entity_data = json.load(f)
-                                        self.manifest_data['base_game'][manifest_type][entity_id] = entity_data
-                                else:
-                                    print(f"Referenced base game entity file not found: {entity_file}")
-                                        
-                        print(f"Loaded base game manifest {manifest_type} with {len(manifest_data.get('ids', []))} entries")
-                    except Exception as e:
-                        print(f"Error loading base game manifest file {manifest_file}: {str(e)}")
-            else:
-                print(f"Base game entities folder not found: {entities_folder}")
+        # A synchronous reload supersedes any background load still in flight
+        self._manifest_signals = None
+        self.manifest_data['base_game'] = _read_base_game_manifests(self.base_game_folder)
+        self.invalidate_file_index()
+        self.log_base_game_manifest_summary()
+
+    def start_base_game_manifest_loader(self) -> None:
+        """Load manifest files from base game on a worker thread"""
+        logging.info("Loading base game manifest files in the background...")
+        loader = ManifestLoader(self.base_game_folder)
+        signals = loader.signals
+        signals.finished.connect(lambda _data, s=signals: self._on_manifests_loaded(s))
+        self._manifest_signals = signals
+        QThreadPool.globalInstance().start(loader)
+
+    def wait_for_base_game_manifests(self) -> None:
+        """Block until a pending background manifest load has been installed"""
+        signals = self._manifest_signals
+        if signals is None:
+            return
+        signals.done.wait()
+        self._on_manifests_loaded(signals)
+
+    def _on_manifests_loaded(self, signals: ManifestLoaderSignals) -> None:
+        """Install base game manifest data produced by the background loader behind signals"""
+        if signals is not self._manifest_signals:
+            return  # Already installed, or superseded by a newer load
+        self._manifest_signals = None
+        self.manifest_data['base_game'] = signals.result
+        self.invalidate_file_index()
+        self.log_base_game_manifest_summary()
+
+    def style_base_game_item(self, item: QListWidgetItem) -> None:
+        """Grey out and italicize a list item showing a base game file, and flag it with BASE_GAME_ROLE.
+        The brush and font are shared, so styling allocates nothing per item"""
+        item.setForeground(self._base_game_brush)
+        item.setFont(self._base_game_font)
+        item.setData(BASE_GAME_ROLE, True)
+
+    def get_file_index(self, file_type: str) -> tuple:
+        """Return (sorted mod ids, sorted base game ids not overridden by the mod) for a manifest type"""
+        index = self._file_index.get(file_type)
+        if index is None:
+            mod_ids = self.manifest_data['mod'].get(file_type, {})
+            base_ids = self.manifest_data['base_game'].get(file_type, {})
+            index = (sorted(mod_ids), sorted(base_ids.keys() - mod_ids.keys()))
+            self._file_index[file_type] = index
+        return index
+
+    def invalidate_file_index(self, file_type: str = None) -> None:
+        """Drop the cached id lists for file_type, or for every type when none is given"""
+        if file_type is None:
+            self._file_index.clear()
         else:
-            logging.warning("No base game folder configured")
-                        
-        # Log summary
+            self._file_index.pop(file_type, None)
+
+    def log_base_game_manifest_summary(self) -> None:
         for manifest_type in self.manifest_data['base_game']:
             count = len(self.manifest_data['base_game'][manifest_type])
             print(f"Total base game {manifest_type} entries: {count}")
@@ -1023,62 +1348,47 @@ class EntityToolGUI(QMainWindow):
                    
     def load_mod_manifest_files(self) -> None:
         """Load manifest files from mod folder into memory"""
+        self.read_mod_manifest_files()()
+    
+    def read_mod_manifest_files(self):
+        """Read the mod folder's manifest files. Safe to run on a worker thread: nothing is stored
+        until the returned function is called, which must happen on the GUI thread"""
         logging.info("Loading mod manifest files...")
         
-        # Clear existing mod manifest data
-        self.manifest_data['mod'] = {}
-        
+        manifests = {}
         if self.current_folder:
             print(f"Using mod folder: {self.current_folder}")
-            entities_folder = self.current_folder / "entities"
-            if entities_folder.exists():
-                print(f"Found mod entities folder: {entities_folder}")
-                for manifest_file in entities_folder.glob("*.entity_manifest"):
-                    try:
-                        manifest_type = manifest_file.stem  # e.g., 'player', 'weapon'
-                        print(f"Loading mod manifest: {manifest_file}")
-                        with open(manifest_file, 'r', encoding='utf-8') as f:
-                            manifest_data = json.load(f)
-                            
-                        if manifest_type not in self.manifest_data['mod']:
-                            self.manifest_data['mod'][manifest_type] = {}
-                            
-                        # Load each referenced entity file
-                        if 'ids' in manifest_data:
-                            for entity_id in manifest_data['ids']:
-                                entity_file = entities_folder / f"{entity_id}.{manifest_type}"
-                                if entity_file.exists():
-                                    with open(entity_file, 'r', encoding='utf-8') as f:
-                                        entity_data = json.load(f)
-                                        self.manifest_data['mod'][manifest_type][entity_id] = entity_data
-                                        print(f"Loaded mod {manifest_type} data for {entity_id}")
-                                else:
-                                    print(f"Referenced mod entity file not found: {entity_file}")
-                                        
-                        print(f"Loaded mod manifest {manifest_type} with {len(manifest_data.get('ids', []))} entries")
-                    except Exception as e:
-                        print(f"Error loading mod manifest file {manifest_file}: {str(e)}")
-            else:
-                print(f"Mod entities folder not found: {entities_folder}")
+            manifests = _read_manifests(self.current_folder / "entities", "mod")
         else:
             logging.warning("No mod folder loaded")
-                        
-        # Log summary
-        for manifest_type in self.manifest_data['mod']:
-            count = len(self.manifest_data['mod'][manifest_type])
-            print(f"Total mod {manifest_type} entries: {count}")
-            if count > 0:
-                print(f"Example {manifest_type} entries: {list(self.manifest_data['mod'][manifest_type].keys())[:3]}")
+        
+        def install():
+            self.manifest_data['mod'] = manifests
+            self.invalidate_file_index()
+                            
+            # Log summary
+            for manifest_type in self.manifest_data['mod']:
+                count = len(self.manifest_data['mod'][manifest_type])
+                print(f"Total mod {manifest_type} entries: {count}")
+                if count > 0:
+                    print(f"Example {manifest_type} entries: {list(self.manifest_data['mod'][manifest_type].keys())[:3]}")
+        return install
                          
     def load_all_localized_strings(self) -> None:
         """Load all localized strings from both mod and base game into memory"""
+        self.read_all_localized_strings()()
+    
+    def read_all_localized_strings(self):
+        """Read all localized strings from both mod and base game. Safe to run on a worker thread:
+        nothing is stored until the returned function is called, which must happen on the GUI thread"""
         logging.info("Loading all localized strings...")
         
         # Initialize dictionaries to store all strings
-        self.all_localized_strings = {
+        strings = {
             'mod': {},  # {language: {key: text}}
             'base_game': {}  # {language: {key: text}}
         }
+        mod_files = {}  # {mod .localized_text file: its data}, for the command stack
         
         # Load mod strings
         if self.current_folder:
@@ -1089,21 +1399,19 @@ class EntityToolGUI(QMainWindow):
                 for text_file in localized_text_folder.glob("*.localized_text"):
                     print(f"Loading mod localized text from: {text_file}")
                     try:
-                        with open(text_file, 'r', encoding='utf-8') as f:
-                            json_data = json.load(f)
-                            # Initialize language dictionary if needed
-                            language = text_file.stem
-                            if language not in self.all_localized_strings['mod']:
-                                self.all_localized_strings['mod'][language] = {}
-                            # Add strings for this language
-                            self.all_localized_strings['mod'][language].update(json_data)
-                            # Initialize command stack with this data
-                            self.command_stack.update_file_data(text_file, json_data)
-                            print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
+                        json_data = _load_json(text_file)
+                        # Add strings for this language, merging in place. Keys repeat across
+                        # languages and sources, so they are interned to share one copy
+                        language = text_file.stem
+                        strings['mod'].setdefault(language, {}).update(
+                            (sys.intern(key), text) for key, text in json_data.items())
+                        # Kept for the command stack
+                        mod_files[text_file] = json_data
+                        print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
                     except Exception as e:
                         print(f"Error loading localized text file {text_file}: {str(e)}")
                         # Initialize with empty data on error
-                        self.command_stack.update_file_data(text_file, {})
+                        mod_files[text_file] = {}
             else:
                 logging.debug("No mod localized_text folder found")
                 # Create the folder
@@ -1111,7 +1419,7 @@ class EntityToolGUI(QMainWindow):
                 # Initialize empty files for current language and English
                 for lang in [self.current_language, "en"]:
                     text_file = localized_text_folder / f"{lang}.localized_text"
-                    self.command_stack.update_file_data(text_file, {})
+                    mod_files[text_file] = {}
         
         # Load base game strings
         if self.base_game_folder:
@@ -1122,15 +1430,13 @@ class EntityToolGUI(QMainWindow):
                 for text_file in localized_text_folder.glob("*.localized_text"):
                     print(f"Loading base game localized text from: {text_file}")
                     try:
-                        with open(text_file, 'r', encoding='utf-8') as f:
-                            json_data = json.load(f)
-                            # Initialize language dictionary if needed
-                            language = text_file.stem
-                            if language not in self.all_localized_strings['base_game']:
-                                self.all_localized_strings['base_game'][language] = {}
-                            # Add strings for this language
-                            self.all_localized_strings['base_game'][language].update(json_data)
-                            print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
+                        json_data = _load_json(text_file)
+                        # Merge in place with interned keys, then drop the parsed dict
+                        language = text_file.stem
+                        strings['base_game'].setdefault(language, {}).update(
+                            (sys.intern(key), text) for key, text in json_data.items())
+                        print(f"Loaded {len(json_data)} strings for language {language} from {text_file}")
+                        del json_data
                     except Exception as e:
                         print(f"Error loading localized text file {text_file}: {str(e)}")
             else:
@@ -1138,51 +1444,118 @@ class EntityToolGUI(QMainWindow):
                         
         # Log summary
         for source in ['mod', 'base_game']:
-            for language in self.all_localized_strings[source]:
-                count = len(self.all_localized_strings[source][language])
+            for language in strings[source]:
+                count = len(strings[source][language])
                 print(f"Total {source} strings for {language}: {count}")
                 if count > 0:
                     # Log a few example strings
                     print(f"Example strings for {source} {language}:")
-                    for i, (key, value) in enumerate(list(self.all_localized_strings[source][language].items())[:3]):
+                    for i, (key, value) in enumerate(list(strings[source][language].items())[:3]):
                         print(f"  {key} = {value}")
                         if i >= 2:
                             break
+        
+        def install():
+            self.all_localized_strings = strings
+            self._localized_merged = {}
+            self._localized_search_index = {}
+            # Initialize command stack with the mod files
+            for text_file, data in mod_files.items():
+                self.command_stack.update_file_data(text_file, data)
+        return install
     
+    def get_merged_localized_strings(self, language: str) -> dict:
+        """Return {key: (text, source)} for a language, with mod strings overriding base game ones"""
+        merged = self._localized_merged.get(language)
+        if merged is None:
+            merged = {key: (text, 'base_game')
+                      for key, text in self.all_localized_strings['base_game'].get(language, {}).items()}
+            merged.update((key, (text, 'mod'))
+                          for key, text in self.all_localized_strings['mod'].get(language, {}).items())
+            self._localized_merged[language] = merged
+        return merged
+
+    def get_localized_search_index(self, language: str) -> list:
+        """Return the merged strings of a language, mod strings first and each part sorted by key, as
+        (key, display text, lower-cased key, lower-cased text, is_base_game), built once per language"""
+        index = self._localized_search_index.get(language)
+        if index is None:
+            index = [(key, f"{key}: {text}", key.lower(), str(text).lower(), source == 'base_game')
+                     for key, (text, source) in self.get_merged_localized_strings(language).items()]
+            index.sort(key=lambda entry: (entry[4], entry[0]))
+            self._localized_search_index[language] = index
+        return index
+
+    def invalidate_localized_indexes(self, language: str) -> None:
+        """Drop the merged strings and search index of a language after its mod strings change"""
+        self._localized_merged.pop(language, None)
+        self._localized_search_index.pop(language, None)
+
     def load_all_texture_files(self) -> None:
         """Load list of all texture files from both mod and base game into memory"""
+        self.read_all_texture_files()()
+    
+    def read_all_texture_files(self):
+        """List all texture files from both mod and base game. Safe to run on a worker thread:
+        nothing is stored until the returned function is called, which must happen on the GUI thread"""
         logging.info("Loading all texture files...")
         
-        # Initialize lists to store texture file paths
-        self.all_texture_files = {
-            'mod': set(),  # Set of texture file names without extension
-            'base_game': set()  # Set of texture file names without extension
+        # Texture file names without extension, mapped to the extension found on disk
+        # (.png is preferred when both a .png and a .dds exist)
+        all_texture_files = {
+            'mod': {},
+            'base_game': {}
         }
         
+        def scan_textures(textures, textures_folder):
+            with os.scandir(textures_folder) as entries:
+                for entry in entries:
+                    stem, dot, ext = entry.name.rpartition('.')
+                    if not dot or not stem:
+                        continue
+                    ext_lower = ext.lower()
+                    if ext_lower == 'png' or (ext_lower == 'dds' and stem not in textures):
+                        textures[sys.intern(stem)] = dot + ext
+        
+        # Texture folders are resolved here, the only place the sources change, so
+        # load_texture does not rebuild them per lookup
+        texture_sources = []
+        
         # Load mod textures
         if self.current_folder:
             textures_folder = self.current_folder / "textures"
+            texture_sources.append((textures_folder, 'mod', False))
             if textures_folder.exists():
-                for texture_file in textures_folder.glob("*.*"):
-                    if texture_file.suffix.lower() in ['.png', '.dds']:
-                        self.all_texture_files['mod'].add(texture_file.stem)
-                print(f"Found {len(self.all_texture_files['mod'])} texture files in mod")
+                scan_textures(all_texture_files['mod'], textures_folder)
+                print(f"Found {len(all_texture_files['mod'])} texture files in mod")
         
         # Load base game textures
         if self.base_game_folder:
             textures_folder = self.base_game_folder / "textures"
+            texture_sources.append((textures_folder, 'base_game', True))
             if textures_folder.exists():
-                for texture_file in textures_folder.glob("*.*"):
-                    if texture_file.suffix.lower() in ['.png', '.dds']:
-                        self.all_texture_files['base_game'].add(texture_file.stem)
-                print(f"Found {len(self.all_texture_files['base_game'])} texture files in base game")
+                scan_textures(all_texture_files['base_game'], textures_folder)
+                print(f"Found {len(all_texture_files['base_game'])} texture files in base game")
+        
+        # Sorted and lower-cased once here, so the texture selector only filters
+        search_entries = {
+            source: [(texture, texture.lower()) for texture in sorted(textures)]
+            for source, textures in all_texture_files.items()
+        }
+        
+        def install():
+            self.all_texture_files = all_texture_files
+            self.texture_sources = texture_sources
+            self.texture_cache.clear()
+            self.texture_preview_cache.clear()
+            self.texture_search_entries = search_entries
+        return install
 
     def load_player_file(self, file_path: Path):
         """Load a player file into the application"""
         try:
-            with open(file_path, encoding='utf-8') as f:
-                data = json.load(f)
-                
+            data = _load_json(file_path)
+            
             self.current_file = file_path
             self.current_data = data
             
@@ -1210,13 +1583,15 @@ class EntityToolGUI(QMainWindow):
             event.ignore()
     
     def dropEvent(self, event: QDropEvent):
-        files = [Path(u.toLocalFile()) for u in event.mimeData().urls()]
-        for path in files:
-            if path.is_dir():
-                self.load_folder(path)
-            elif path.is_file():
-                self.load_file(path)
-            break  # Only load the first item
+        urls = event.mimeData().urls()
+        if not urls:
+            return
+        # Only the first item is loaded
+        path = Path(urls[0].toLocalFile())
+        if path.is_dir():
+            self.load_folder(path)
+        elif path.is_file():
+            self.load_file(path)
     
     def closeEvent(self, event):
         """Handle window close event"""
@@ -1255,6 +1630,11 @@ class EntityToolGUI(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+        
+        # Files created with compact JSON are re-indented on every path that closes the
+        # window, not only when saving (a no-op if save_changes already did it)
+        if event.isAccepted():
+            self.command_stack.flush_pretty()
 
     def open_folder_dialog(self):
         """Open directory dialog to select mod folder"""
@@ -1333,16 +1713,21 @@ class EntityToolGUI(QMainWindow):
                 "base_game_folder": str(self.base_game_folder) if self.base_game_folder else "",
                 "schema_folder": str(self.config.get("schema_folder", ""))
             }
-            with open('config.json', 'w') as f:
-                json.dump(config_to_save, f, indent=4)
-            logging.info("Configuration saved successfully")
+            writer = ConfigWriter(json.dumps(config_to_save, indent=4).encode('utf-8'))
+            writer.signals.failed.connect(self._on_config_save_failed)
+            self._config_pool.start(writer)
+            logging.info("Configuration save queued")
         except Exception as e:
-            logging.error(f"Failed to save config.json: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to save configuration: {str(e)}")
+            self._on_config_save_failed(str(e))
+
+    @pyqtSlot(str)
+    def _on_config_save_failed(self, message: str):
+        logging.error(f"Failed to save config.json: {message}")
+        QMessageBox.warning(self, "Error", f"Failed to save configuration: {message}")
 
     def show_context_menu(self, widget, position, current_value):
         """Show the context menu at the given position"""
-        print(f"show_context_menu called for widget: {widget}, position: {position}")
+        logging.debug("show_context_menu called for widget: %s, position: %s", widget, position)
         menu = self.create_context_menu(widget, current_value)
         if menu:
             logging.debug("Menu created, about to show")
@@ -1357,23 +1742,21 @@ class EntityToolGUI(QMainWindow):
         # Get schema and data path from widget or its container
         schema = None
         data_path = widget.property("data_path")
-        print(f"Creating context menu for path: {data_path}")
+        logging.debug("Creating context menu for path: %s", data_path)
             
         if data_path is not None:  # Changed from 'if data_path:' to handle empty lists
             # Find the schema for this path
             schema = self.get_schema_for_path(data_path)
-            print(f"Got schema for path {data_path}: {schema}")
+            logging.debug("Got schema for path %s: %s", data_path, schema)
             
             # For top-level objects, we need to resolve references in the schema itself
             if not data_path and schema and "$ref" in schema:
                 schema = self.resolve_schema_references(schema)
-                print(f"Resolved top-level schema reference: {schema}")
+                logging.debug("Resolved top-level schema reference: %s", schema)
         
         # Check if this is a property label/header for later use
         property_name = None
-        is_property_label = (isinstance(widget, (QLabel, QToolButton)) and 
-                           not isinstance(widget.parent(), QHBoxLayout) and
-                           not widget.property("is_array_index"))
+        is_property_label = widget.property("is_property_label") is True
         
         if is_property_label:
             # Try to find property name from various widget types
@@ -1387,37 +1770,46 @@ class EntityToolGUI(QMainWindow):
             add_menu = menu.addMenu("Add..." if isinstance(current_value, dict) else "Add Item")
             
             if isinstance(current_value, dict):
-                # Resolve schema references before checking properties
-                schema = self.resolve_schema_references(schema)
-                print(f"Resolved schema for properties: {schema}")
-
-                # Get available properties from schema
-                properties = schema.get("properties", {})
-                required = schema.get("required", [])
-                # Get currently used properties
-                used_props = set(current_value.keys())
-                print(f"Used properties: {used_props}")
-                print(f"Available properties: {properties.keys()}")
-                
-                # Add menu items for each available property
-                has_available_props = False
-                for prop_name, prop_schema in sorted(properties.items()):
-                    if prop_name not in used_props:
-                        has_available_props = True
-                        action = add_menu.addAction(prop_name)
-                        is_required = prop_name in required
-                        if is_required:
-                            action.setText(f"{prop_name} (required)")
-                        action.triggered.connect(
-                            lambda checked, n=prop_name, s=prop_schema: 
-                            self.add_property(widget, n, s)
-                        )
+                object_schema = schema
+                
+                def populate_add_menu():
+                    """Fill the property submenu the first time it is opened"""
+                    if add_menu.actions():
+                        return
+                    # Resolve schema references before checking properties
+                    resolved = self.resolve_schema_references(object_schema)
+                    logging.debug("Resolved schema for properties: %s", resolved)
+
+                    # Get available properties from schema
+                    properties = resolved.get("properties", {})
+                    required = resolved.get("required", [])
+                    # Get currently used properties
+                    used_props = set(current_value.keys())
+                    logging.debug("Used properties: %s", used_props)
+                    logging.debug("Available properties: %s", properties.keys())
                     
-                # If no available properties, add a disabled message
-                if not has_available_props:
-                    print("No available properties found")
-                    action = add_menu.addAction("No available properties")
-                    action.setEnabled(False)
+                    # Add menu items for each available property
+                    has_available_props = False
+                    for prop_name, prop_schema in self.sorted_schema_properties(properties):
+                        if prop_name not in used_props:
+                            has_available_props = True
+                            action = add_menu.addAction(prop_name)
+                            is_required = prop_name in required
+                            if is_required:
+                                action.setText(f"{prop_name} (required)")
+                            action.triggered.connect(
+                                lambda checked, n=prop_name, s=prop_schema: 
+                                self.add_property(widget, n, s)
+                            )
+                        
+                    # If no available properties, add a disabled message
+                    if not has_available_props:
+                        logging.debug("No available properties found")
+                        action = add_menu.addAction("No available properties")
+                        action.setEnabled(False)
+                
+                # Built on first open, so a right click only pays for the submenus actually shown
+                add_menu.aboutToShow.connect(populate_add_menu)
         
             elif isinstance(current_value, list):
                 # Get item schema and resolve references
@@ -1433,25 +1825,31 @@ class EntityToolGUI(QMainWindow):
         if not isinstance(current_value, (dict, list)):
             select_menu = menu.addMenu("Select from...")
             
-            # File selection action
-            file_action = select_menu.addAction("File...")
-            file_action.triggered.connect(lambda: self.show_file_selector(widget))
-            
-            # Uniforms selection action
-            uniforms_action = select_menu.addAction("Uniforms...")
-            uniforms_action.triggered.connect(lambda: self.show_uniforms_selector(widget))
-            
-            # Localized text selection action
-            text_action = select_menu.addAction("Localized Text...")
-            text_action.triggered.connect(lambda: self.show_localized_text_selector(widget))
-            
-            # Texture selection action
-            texture_action = select_menu.addAction("Texture...")
-            texture_action.triggered.connect(lambda: self.show_texture_selector(widget))
+            def populate_select_menu():
+                """Fill the selector submenu the first time it is opened"""
+                if select_menu.actions():
+                    return
+                # File selection action
+                file_action = select_menu.addAction("File...")
+                file_action.triggered.connect(lambda: self.show_file_selector(widget))
+                
+                # Uniforms selection action
+                uniforms_action = select_menu.addAction("Uniforms...")
+                uniforms_action.triggered.connect(lambda: self.show_uniforms_selector(widget))
+                
+                # Localized text selection action
+                text_action = select_menu.addAction("Localized Text...")
+                text_action.triggered.connect(lambda: self.show_localized_text_selector(widget))
+                
+                # Texture selection action
+                texture_action = select_menu.addAction("Texture...")
+                texture_action.triggered.connect(lambda: self.show_texture_selector(widget))
+                
+                # Sound selection action
+                sound_action = select_menu.addAction("Sounds...")
+                sound_action.triggered.connect(lambda: self.show_sound_selector(widget))
             
-            # Sound selection action
-            sound_action = select_menu.addAction("Sounds...")
-            sound_action.triggered.connect(lambda: self.show_sound_selector(widget))
+            select_menu.aboutToShow.connect(populate_select_menu)
             
         # Add Delete Property option at the end if this is a property label/header
         if is_property_label and property_name and data_path:
@@ -1469,6 +1867,12 @@ class EntityToolGUI(QMainWindow):
 
     def show_file_selector(self, target_widget):
         """Show a dialog to select a file from mod or base game"""
+        # The dialog is built once; reopening it only retargets it and refreshes the list
+        if self._file_selector is not None:
+            self._file_selector(target_widget)
+            return
+        selector = {'target': target_widget}
+        
         dialog = QDialog(self)
         dialog.setWindowTitle("Select File")
         dialog.resize(800, 600)  # Make the dialog larger
@@ -1478,8 +1882,16 @@ class EntityToolGUI(QMainWindow):
         type_layout = QHBoxLayout()
         type_label = QLabel("File Type:")
         type_combo = QComboBox()
-        type_combo.addItems(sorted(set(self.manifest_data['mod'].keys()) | 
-                                 set(self.manifest_data['base_game'].keys())))
+        
+        def fill_types():
+            """(Re)fill the type combo if the available manifest types changed"""
+            file_types = sorted(set(self.manifest_data['mod'].keys()) | 
+                                set(self.manifest_data['base_game'].keys()))
+            if file_types != [type_combo.itemText(i) for i in range(type_combo.count())]:
+                type_combo.clear()
+                type_combo.addItems(file_types)
+        
+        fill_types()
         type_layout.addWidget(type_label)
         type_layout.addWidget(type_combo)
         layout.addLayout(type_layout)
@@ -1493,30 +1905,64 @@ class EntityToolGUI(QMainWindow):
         file_list = QListWidget()
         layout.addWidget(file_list)
         
+        # Items are built once per file index (one per type, replaced when the manifests change);
+        # searching only hides and shows them. visible holds the entries matching search, so a
+        # longer query only rechecks those
+        pool = {'index': None, 'entries': [], 'search': '', 'visible': []}  # entries: [(item, lower-cased id)]
+        
         def update_file_list():
-            file_list.clear()
             file_type = type_combo.currentText()
             search_text = search_box.text().lower()
-            
-            # Add mod files first
-            for file_id in sorted(self.manifest_data['mod'].get(file_type, {})):
-                if search_text in file_id.lower():
-                    item = QListWidgetItem(file_id)
-                    file_list.addItem(item)
-                    
-            # Then add base game files (grayed out)
-            for file_id in sorted(self.manifest_data['base_game'].get(file_type, {})):
-                if (file_id not in self.manifest_data['mod'].get(file_type, {}) and 
-                    search_text in file_id.lower()):
-                    item = QListWidgetItem(file_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    file_list.addItem(item)
-        
+            file_list.setUpdatesEnabled(False)
+            try:
+                file_index = self.get_file_index(file_type)
+                if pool['index'] is not file_index:
+                    file_list.clear()
+                    mod_ids, base_only_ids = file_index
+                
+                    # Add mod files first
+                    file_list.addItems(mod_ids)
+                        
+                    # Then add base game files in one insert and grey them out in place.
+                    # UserRole flags them as base game files for on_copy
+                    first_base_row = file_list.count()
+                    file_list.addItems(base_only_ids)
+                    for row in range(first_base_row, file_list.count()):
+                        item = file_list.item(row)
+                        item.setForeground(self._base_game_brush)
+                        item.setFont(self._base_game_font)
+                        item.setData(Qt.ItemDataRole.UserRole, True)
+                
+                    pool['index'] = file_index
+                    pool['entries'] = [(file_list.item(row), file_list.item(row).text().lower())
+                                       for row in range(file_list.count())]
+                    pool['search'] = ''
+                    pool['visible'] = pool['entries']
+            
+                if search_text.startswith(pool['search']):
+                    # The query only got longer: anything hidden stays hidden
+                    visible = []
+                    for entry in pool['visible']:
+                        if search_text in entry[1]:
+                            visible.append(entry)
+                        else:
+                            entry[0].setHidden(True)
+                else:
+                    visible = []
+                    for entry in pool['entries']:
+                        matches = search_text in entry[1]
+                        entry[0].setHidden(not matches)
+                        if matches:
+                            visible.append(entry)
+                pool['search'] = search_text
+                pool['visible'] = visible
+            finally:
+                file_list.setUpdatesEnabled(True)
+        
+        # Typing restarts the timer, so a burst of keystrokes rebuilds the list once
+        search_timer = _debounce(dialog, update_file_list)
         type_combo.currentTextChanged.connect(update_file_list)
-        search_box.textChanged.connect(update_file_list)
+        search_box.textChanged.connect(lambda _: search_timer.start())
         update_file_list()  # Initial population
         
         # Buttons
@@ -1534,7 +1980,7 @@ class EntityToolGUI(QMainWindow):
         def on_select():
             if file_list.currentItem():
                 new_value = file_list.currentItem().text()
-                self.on_select_value(target_widget, new_value)
+                self.on_select_value(selector['target'], new_value)
                 dialog.accept()
                 
         def on_copy():
@@ -1543,7 +1989,7 @@ class EntityToolGUI(QMainWindow):
                 
             source_file = file_list.currentItem().text()
             file_type = type_combo.currentText()
-            is_base_game = file_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            is_base_game = file_list.currentItem().data(Qt.ItemDataRole.UserRole) is True
             
             # Show copy dialog
             copy_dialog = QDialog(dialog)
@@ -1587,8 +2033,8 @@ class EntityToolGUI(QMainWindow):
                     
                 try:
                     # Get the file path and data path from the target widget
-                    file_path = self.get_schema_view_file_path(target_widget)
-                    data_path = target_widget.property("data_path")
+                    file_path = self.get_schema_view_file_path(selector['target'])
+                    data_path = selector['target'].property("data_path")
                     
                     # Create the copy command
                     copy_command = CreateFileFromCopy(
@@ -1610,7 +2056,7 @@ class EntityToolGUI(QMainWindow):
                         return
                         
                     # Create transform command for the widget
-                    transform_cmd = TransformWidgetCommand(self, target_widget, source_file, new_name)
+                    transform_cmd = TransformWidgetCommand(self, selector['target'], source_file, new_name)
                     transform_cmd.file_path = file_path
                     transform_cmd.data_path = data_path
                     
@@ -1627,6 +2073,7 @@ class EntityToolGUI(QMainWindow):
                     self.command_stack.push(composite_cmd)
                     
                     # Update the file list
+                    pool['index'] = None
                     update_file_list()
                     
                     # Select the new file
@@ -1652,13 +2099,62 @@ class EntityToolGUI(QMainWindow):
         file_list.itemDoubleClicked.connect(on_select)
         file_list.currentItemChanged.connect(on_current_item_changed)
         
+        def reopen(new_target):
+            selector['target'] = new_target
+            fill_types()
+            search_box.clear()
+            update_file_list()
+            file_list.setCurrentItem(None)
+            dialog.exec()
+        
+        self._file_selector = reopen
         dialog.exec()
 
+    def list_folder_files(self, folder: Path, suffix: str, recursive: bool = False) -> frozenset:
+        """Return the paths of the files in folder ending in suffix (lower-case, matched case-insensitively),
+        relative to it with '/' separators. The same frozenset is returned until one of the scanned
+        directories' modification time changes, so callers can compare listings by identity"""
+        key = (folder, suffix, recursive)
+        cached = self._folder_files.get(key)
+        if cached is not None:
+            try:
+                if all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in cached[0].items()):
+                    return cached[1]
+            except OSError:
+                pass
+        if not folder.is_dir():
+            self._folder_files.pop(key, None)
+            return frozenset()
+        found, dir_mtimes = _scan_files(folder, suffix, recursive)
+        self._folder_files[key] = (dir_mtimes, found)
+        return found
+
+    def get_sound_files(self) -> dict:
+        """Get all .ogg files from mod and base game as sorted (path, lower-cased path) lists,
+        base game files overridden by the mod left out"""
+        mod_sounds = self.list_folder_files(self.current_folder / "sounds", ".ogg", recursive=True) if self.current_folder else frozenset()
+        base_sounds = self.list_folder_files(self.base_game_folder / "sounds", ".ogg", recursive=True) if self.base_game_folder else frozenset()
+        cached = self._sound_files_cache
+        if cached is None or cached[0] is not mod_sounds or cached[1] is not base_sounds:
+            sound_files = {
+                'mod': [(sound, sound.lower()) for sound in sorted(mod_sounds)],
+                'base_game': [(sound, sound.lower()) for sound in sorted(base_sounds - mod_sounds)]
+            }
+            cached = (mod_sounds, base_sounds, sound_files)
+            self._sound_files_cache = cached
+        return cached[2]
+
     def show_uniforms_selector(self, target_widget):
         """Show a dialog to select a uniform value"""
         # Set the is_uniform property on the target widget
         target_widget.setProperty("is_uniform", True)
         
+        # The dialog is built once; reopening it only retargets it and refreshes what changed
+        if self._uniforms_selector is not None:
+            self._uniforms_selector(target_widget)
+            return
+        selector = {'target': target_widget, 'listing': None, 'tree_key': None}
+        
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Uniform Value")
         dialog.resize(800, 600)
@@ -1669,40 +2165,29 @@ class EntityToolGUI(QMainWindow):
         file_label = QLabel("Uniforms File:")
         file_combo = QComboBox()
         
-        # Get all available uniform files from both mod and base game
-        mod_uniforms = set()
-        base_uniforms = set()
-        
-        # Get mod uniforms
-        if self.current_folder:
-            mod_uniforms_dir = self.current_folder / "uniforms"
-            if mod_uniforms_dir.exists():
-                for file_path in mod_uniforms_dir.glob("*.uniforms"):
-                    mod_uniforms.add(file_path.stem)
-        
-        # Get base game uniforms
-        if self.base_game_folder:
-            base_uniforms_dir = self.base_game_folder / "uniforms"
-            if base_uniforms_dir.exists():
-                for file_path in base_uniforms_dir.glob("*.uniforms"):
-                    base_uniforms.add(file_path.stem)
-        
-        # Add all files to combo box, marking their source
-        all_files = sorted(mod_uniforms | base_uniforms)
-        for file_id in all_files:
-            # Add mod version if it exists
-            if file_id in mod_uniforms:
-                file_combo.addItem(f"{file_id} (Mod)")
-            
-            # Add base game version if it exists
-            if file_id in base_uniforms:
-                file_combo.addItem(file_id)
-                # Style base game items
-                index = file_combo.count() - 1
-                file_combo.setItemData(index, QColor(150, 150, 150), Qt.ItemDataRole.ForegroundRole)
-                font = file_combo.itemData(index, Qt.ItemDataRole.FontRole) or QFont()
-                font.setItalic(True)
-                file_combo.setItemData(index, font, Qt.ItemDataRole.FontRole)
+        def fill_files():
+            """(Re)fill the file combo if either uniforms folder listing changed"""
+            # Get all available uniform files from both mod and base game
+            mod_listing = self.list_folder_files(self.current_folder / "uniforms", ".uniforms") if self.current_folder else frozenset()
+            base_listing = self.list_folder_files(self.base_game_folder / "uniforms", ".uniforms") if self.base_game_folder else frozenset()
+            if selector['listing'] is not None and selector['listing'][0] is mod_listing and selector['listing'][1] is base_listing:
+                return
+            selector['listing'] = (mod_listing, base_listing)
+            mod_uniforms = {name[:-len(".uniforms")] for name in mod_listing}
+            base_uniforms = {name[:-len(".uniforms")] for name in base_listing}
+            
+            # Add all files to combo box in one call, mod files (marked) first, then the
+            # base game files the mod does not override
+            file_combo.clear()
+            file_combo.addItems([f"{file_id} (Mod)" for file_id in sorted(mod_uniforms)])
+            first_base_index = file_combo.count()
+            file_combo.addItems(sorted(base_uniforms - mod_uniforms))
+            # Style base game items
+            for index in range(first_base_index, file_combo.count()):
+                file_combo.setItemData(index, self._base_game_brush, Qt.ItemDataRole.ForegroundRole)
+                file_combo.setItemData(index, self._base_game_font, Qt.ItemDataRole.FontRole)
+        
+        fill_files()
         
         file_layout.addWidget(file_label)
         file_layout.addWidget(file_combo)
@@ -1712,35 +2197,37 @@ class EntityToolGUI(QMainWindow):
         tree = QTreeWidget()
         tree.setHeaderLabels(["Key", "Value"])
         tree.setColumnWidth(0, 300)  # Give more space to the key column
+        # Base game files are styled by swapping the delegate rather than styling every item
+        default_delegate = tree.itemDelegate()
+        base_game_delegate = BaseGameItemDelegate(tree)
         layout.addWidget(tree)
         
-        def add_item(parent, key, value, full_path=""):
-            """Recursively add items to the tree"""
-            if full_path:
-                new_path = f"{full_path}.{key}" if isinstance(key, str) else f"{full_path}[{key}]"
-            else:
-                new_path = str(key)
-                
-            item = QTreeWidgetItem(parent)
-            item.setText(0, str(key))
-            
-            if isinstance(value, dict):
-                item.setText(1, "{...}")
-                for k, v in sorted(value.items()):
-                    add_item(item, k, v, new_path)
-            elif isinstance(value, list):
-                item.setText(1, f"[{len(value)} items]")
-                for i, v in enumerate(value):
-                    add_item(item, i, v, new_path)
-            else:
-                item.setText(1, str(value))
-                # Store the full path and value for selection
-                item.setData(0, Qt.ItemDataRole.UserRole, (new_path, value))
+        def build_tree(data):
+            """Add items for data to the tree depth first, using an explicit stack instead of recursion.
+            Paths are kept as parts and only joined for leaves, the only items that store one"""
+            stack = [(tree, key, value, (str(key),)) for key, value in reversed(sorted(data.items()))]
+            while stack:
+                parent, key, value, path_parts = stack.pop()
+                if isinstance(value, dict):
+                    item = QTreeWidgetItem(parent, [str(key), "{...}"])
+                    children = [(k, v, f".{k}") for k, v in sorted(value.items())]
+                elif isinstance(value, list):
+                    item = QTreeWidgetItem(parent, [str(key), f"[{len(value)} items]"])
+                    children = [(i, v, f"[{i}]") for i, v in enumerate(value)]
+                else:
+                    item = QTreeWidgetItem(parent, [str(key), str(value)])
+                    # Store the full path and value for selection
+                    item.setData(0, Qt.ItemDataRole.UserRole, ("".join(path_parts), value))
+                    continue
+                # Pushed in reverse so children are created, and therefore ordered, as listed
+                for k, v, part in reversed(children):
+                    stack.append((item, k, v, path_parts + (part,)))
         
         def update_tree():
-            tree.clear()
             selected_text = file_combo.currentText()
             if not selected_text:
+                tree.clear()
+                selector['tree_key'] = None
                 return
                 
             # Determine if this is a mod or base game file
@@ -1754,30 +2241,28 @@ class EntityToolGUI(QMainWindow):
                 else:
                     file_path = self.current_folder / "uniforms" / f"{file_id}.uniforms"
                 
-                if file_path and file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for key, value in sorted(data.items()):
-                            add_item(tree, key, value)
-                            
+                # The tree is only rebuilt when another file, or a newer version of it, is selected
+                try:
+                    tree_key = (file_path, file_path.stat().st_mtime_ns)
+                except OSError:
+                    tree_key = None
+                if tree_key is not None and tree_key == selector['tree_key']:
+                    return  # The tree already shows this file
+                data = self.read_json_cached(file_path)
+                tree.clear()
+                selector['tree_key'] = tree_key
+                if data is not None:
+                    tree.setUpdatesEnabled(False)
+                    try:
+                        build_tree(data)
+                    finally:
+                        tree.setUpdatesEnabled(True)
+                    tree.setItemDelegate(base_game_delegate if is_base_game else default_delegate)
                     tree.expandToDepth(0)  # Expand first level by default
-                    
-                    # Style items if base game
-                    if is_base_game:
-                        def style_items(item):
-                            item.setForeground(0, QColor(150, 150, 150))
-                            item.setForeground(1, QColor(150, 150, 150))
-                            font = item.font(0)
-                            font.setItalic(True)
-                            item.setFont(0, font)
-                            item.setFont(1, font)
-                            for i in range(item.childCount()):
-                                style_items(item.child(i))
-                                
-                        for i in range(tree.topLevelItemCount()):
-                            style_items(tree.topLevelItem(i))
                             
             except Exception as e:
+                tree.clear()
+                selector['tree_key'] = None
                 print(f"Error loading uniforms file: {str(e)}")
         
         def on_item_selected():
@@ -1789,13 +2274,15 @@ class EntityToolGUI(QMainWindow):
             if data:  # Only leaf nodes have data
                 path, value = data
                 new_value = str(value) if not isinstance(value, (dict, list)) else path
-                self.on_select_value(target_widget, new_value)
+                self.on_select_value(selector['target'], new_value)
                 dialog.accept()
         
         def on_item_double_clicked(item, column):
             on_item_selected()
         
-        file_combo.currentTextChanged.connect(update_tree)
+        # Scrolling through the combo with the keyboard only loads the file it stops on
+        tree_timer = _debounce(dialog, update_tree)
+        file_combo.currentTextChanged.connect(lambda _: tree_timer.start())
         tree.itemDoubleClicked.connect(on_item_double_clicked)
         update_tree()  # Initial population
         
@@ -1817,10 +2304,24 @@ class EntityToolGUI(QMainWindow):
         select_btn.clicked.connect(on_item_selected)
         cancel_btn.clicked.connect(dialog.reject)
         
+        def reopen(new_target):
+            selector['target'] = new_target
+            fill_files()
+            update_tree()
+            tree.setCurrentItem(None)
+            dialog.exec()
+        
+        self._uniforms_selector = reopen
         dialog.exec()
 
     def show_localized_text_selector(self, target_widget):
         """Show a dialog to select localized text"""
+        # The dialog is built once; reopening it only retargets it and refreshes the list
+        if self._localized_text_selector is not None:
+            self._localized_text_selector(target_widget)
+            return
+        selector = {'target': target_widget}
+        
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Localized Text")
         dialog.resize(800, 600)  # Make the dialog larger
@@ -1831,18 +2332,25 @@ class EntityToolGUI(QMainWindow):
         lang_label = QLabel("Language:")
         lang_combo = QComboBox()
         
-        # Get all available languages
-        all_languages = set()
-        for source in ['mod', 'base_game']:
-            all_languages.update(self.all_localized_strings[source].keys())
-        
-        lang_combo.addItems(sorted(all_languages))
-        # Set current language if available, otherwise default to English
-        current_index = lang_combo.findText(self.current_language)
-        if current_index >= 0:
-            lang_combo.setCurrentIndex(current_index)
-        elif lang_combo.findText("en") >= 0:
-            lang_combo.setCurrentIndex(lang_combo.findText("en"))
+        def fill_languages():
+            """(Re)fill the language combo if the languages changed and select the current one"""
+            # Get all available languages
+            all_languages = set()
+            for source in ['mod', 'base_game']:
+                all_languages.update(self.all_localized_strings[source].keys())
+            
+            languages = sorted(all_languages)
+            if languages != [lang_combo.itemText(i) for i in range(lang_combo.count())]:
+                lang_combo.clear()
+                lang_combo.addItems(languages)
+            # Set current language if available, otherwise default to English
+            current_index = lang_combo.findText(self.current_language)
+            if current_index >= 0:
+                lang_combo.setCurrentIndex(current_index)
+            elif lang_combo.findText("en") >= 0:
+                lang_combo.setCurrentIndex(lang_combo.findText("en"))
+        
+        fill_languages()
             
         lang_layout.addWidget(lang_label)
         lang_layout.addWidget(lang_combo)
@@ -1857,34 +2365,45 @@ class EntityToolGUI(QMainWindow):
         text_list = QListWidget()
         layout.addWidget(text_list)
         
+        # Items are built once per search index (one per language, replaced when its strings
+        # change); searching only hides and shows them
+        pool = {'index': None, 'entries': []}  # entries: [(item, lower-cased key, lower-cased text)]
+        
         def update_text_list(search=""):
-            text_list.clear()
-            search = search.lower()
-            current_lang = lang_combo.currentText()
+            text_list.setUpdatesEnabled(False)
+            try:
+                search = search.lower()
+                current_lang = lang_combo.currentText()
             
-            # Helper to add items with proper styling
-            def add_items(items, is_base_game=False):
-                for key, value in sorted(items.items()):
-                    if search in key.lower() or search in str(value).lower():
-                        item = QListWidgetItem(f"{key}: {value}")
+                index = self.get_localized_search_index(current_lang)
+                if pool['index'] is not index:
+                    text_list.clear()
+                    entries = []
+                
+                    # One row per key (mod texts first, then base game texts the mod does not
+                    # override), inserted in one call. The sorted, lower-cased text comes from
+                    # the per-language search index
+                    text_list.addItems([display for _, display, _, _, _ in index])
+                    for row, (key, _, key_lower, value_lower, is_base_game) in enumerate(index):
+                        item = text_list.item(row)
                         item.setData(Qt.ItemDataRole.UserRole, key)  # Store just the key
                         if is_base_game:
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                        text_list.addItem(item)
-            
-            # Add mod texts first
-            if current_lang in self.all_localized_strings['mod']:
-                add_items(self.all_localized_strings['mod'][current_lang])
-            
-            # Then add base game texts
-            if current_lang in self.all_localized_strings['base_game']:
-                add_items(self.all_localized_strings['base_game'][current_lang], True)
-        
-        search_box.textChanged.connect(update_text_list)
-        lang_combo.currentTextChanged.connect(lambda: update_text_list(search_box.text()))
+                            item.setForeground(self._base_game_brush)
+                            item.setFont(self._base_game_font)
+                        entries.append((item, key_lower, value_lower))
+                
+                    pool['index'] = index
+                    pool['entries'] = entries
+            
+                for item, key, value in pool['entries']:
+                    item.setHidden(search not in key and search not in value)
+            finally:
+                text_list.setUpdatesEnabled(True)
+        
+        # Typing and language changes restart the timer, so a burst of them rebuilds the list once
+        search_timer = _debounce(dialog, lambda: update_text_list(search_box.text()))
+        search_box.textChanged.connect(lambda _: search_timer.start())
+        lang_combo.currentTextChanged.connect(lambda _: search_timer.start())
         update_text_list()  # Initial population
         
         # Buttons
@@ -1944,13 +2463,12 @@ class EntityToolGUI(QMainWindow):
                     
                 # Check if key already exists
                 current_lang = lang_combo.currentText()
-                if (current_lang in self.all_localized_strings['mod'] and 
-                    key in self.all_localized_strings['mod'][current_lang]):
+                existing = self.get_merged_localized_strings(current_lang).get(key)
+                if existing and existing[1] == 'mod':
                     QMessageBox.warning(create_dialog, "Error", "Key already exists in mod")
                     return
                     
-                if (current_lang in self.all_localized_strings['base_game'] and 
-                    key in self.all_localized_strings['base_game'][current_lang]):
+                if existing:
                     reply = QMessageBox.question(
                         create_dialog,
                         "Key Exists in Base Game",
@@ -1966,6 +2484,7 @@ class EntityToolGUI(QMainWindow):
                 self.command_stack.push(command)
                 
                 # Update the list and select the new item
+                pool['index'] = None
                 update_text_list()
                 for i in range(text_list.count()):
                     item = text_list.item(i)
@@ -1984,7 +2503,7 @@ class EntityToolGUI(QMainWindow):
             item = text_list.currentItem()
             if item:
                 new_value = item.data(Qt.ItemDataRole.UserRole)
-                self.on_select_value(target_widget, new_value)
+                self.on_select_value(selector['target'], new_value)
                 dialog.accept()
         
         def on_item_double_clicked(item):
@@ -2000,11 +2519,19 @@ class EntityToolGUI(QMainWindow):
         create_btn.clicked.connect(show_create_dialog)
         cancel_btn.clicked.connect(dialog.reject)
         
+        def reopen(new_target):
+            selector['target'] = new_target
+            fill_languages()
+            search_box.clear()
+            update_text_list()
+            text_list.setCurrentItem(None)
+            dialog.exec()
+        
+        self._localized_text_selector = reopen
         dialog.exec()
 
     def show_array_item_menu(self, widget: QWidget, pos):
         """Show context menu for array item indices"""
-        print("Showing array item menu")
         menu = QMenu()
         
         # Get data path and array data
@@ -2037,8 +2564,10 @@ class EntityToolGUI(QMainWindow):
         search_box.setPlaceholderText("Search textures...")
         left_layout.addWidget(search_box)
         
-        # Create list widget for textures
-        texture_list = QListWidget()
+        # Create list view for textures, filled through a model so a search is a single reset
+        texture_model = EntityListModel(dialog)
+        texture_list = _batched_list(QListView())
+        texture_list.setModel(texture_model)
         left_layout.addWidget(texture_list)
         
         # Right side with preview
@@ -2053,28 +2582,20 @@ class EntityToolGUI(QMainWindow):
         right_layout.addWidget(preview_label)
         right_layout.addStretch()
         
+        # Sorted (name, lower-cased name) pairs, built when the textures are loaded
+        mod_textures = self.texture_search_entries['mod']
+        base_textures = self.texture_search_entries['base_game']
+        
         def update_texture_list(search=""):
-            texture_list.clear()
             search = search.lower()
             
-            def add_textures(textures, is_base_game=False):
-                for texture in sorted(textures):
-                    if search in texture.lower():
-                        item = QListWidgetItem(texture)
-                        if is_base_game:
-                            item.setForeground(QColor(150, 150, 150))
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-                        texture_list.addItem(item)
-            
-            # Add mod textures first
-            add_textures(self.all_texture_files['mod'])
-            # Then add base game textures
-            add_textures(self.all_texture_files['base_game'], True)
+            # Mod textures first, then base game textures
+            texture_model.set_rows([texture for texture, texture_lower in mod_textures if search in texture_lower],
+                                   [texture for texture, texture_lower in base_textures if search in texture_lower])
         
-        # Connect search box
-        search_box.textChanged.connect(update_texture_list)
+        # Typing restarts the timer, so a burst of keystrokes rebuilds the list once
+        search_timer = _debounce(dialog, lambda: update_texture_list(search_box.text()))
+        search_box.textChanged.connect(lambda _: search_timer.start())
         
         # Buttons
         button_box = QHBoxLayout()
@@ -2087,31 +2608,52 @@ class EntityToolGUI(QMainWindow):
         left_layout.addLayout(button_box)
         
         def on_item_selected():
-            if texture_list.currentItem():
-                new_value = texture_list.currentItem().text()
+            current = texture_list.currentIndex()
+            if current.isValid():
+                new_value = texture_model.row_text(current.row())
                 self.on_select_value(target_widget, new_value)
                 dialog.accept()
         
-        def on_item_double_clicked(item):
+        def on_item_double_clicked(index):
             on_item_selected()
         
+        def update_preview():
+            """Load, scale and show the preview of the current texture"""
+            current = texture_list.currentIndex()
+            if not current.isValid():
+                return
+            texture_name = texture_model.row_text(current.row())
+            pixmap, _ = self.load_texture(texture_name)
+            if pixmap:
+                # Scale pixmap to fit preview area while maintaining aspect ratio. Large textures are
+                # first reduced to twice the preview size without filtering, so the smooth pass is cheap
+                if max(pixmap.width(), pixmap.height()) > 600:
+                    pixmap = pixmap.scaled(600, 600, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+                scaled_pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self.texture_preview_cache[(self.current_folder, texture_name)] = scaled_pixmap
+                preview_label.setPixmap(scaled_pixmap)
+            else:
+                preview_label.setText("No preview available")
+        
+        # Moving through the list restarts the timer, so only the texture it stops on is loaded
+        preview_timer = _debounce(dialog, update_preview)
+        
         def on_current_item_changed(current, previous):
-            select_btn.setEnabled(current is not None)
-            if current:
-                # Update preview
-                texture_name = current.text()
-                pixmap, _ = self.load_texture(texture_name)
-                if pixmap:
-                    # Scale pixmap to fit preview area while maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            select_btn.setEnabled(current.isValid())
+            if current.isValid():
+                # Update preview, showing the scaled pixmap of textures shown before right away
+                scaled_pixmap = self.texture_preview_cache.get((self.current_folder, texture_model.row_text(current.row())))
+                if scaled_pixmap is not None:
+                    preview_timer.stop()
                     preview_label.setPixmap(scaled_pixmap)
                 else:
-                    preview_label.setText("No preview available")
+                    preview_timer.start()
             else:
+                preview_timer.stop()
                 preview_label.clear()
         
-        texture_list.currentItemChanged.connect(on_current_item_changed)
-        texture_list.itemDoubleClicked.connect(on_item_double_clicked)
+        texture_list.selectionModel().currentChanged.connect(on_current_item_changed)
+        texture_list.doubleClicked.connect(on_item_double_clicked)
         select_btn.clicked.connect(on_item_selected)
         cancel_btn.clicked.connect(dialog.reject)
         
@@ -2121,10 +2663,6 @@ class EntityToolGUI(QMainWindow):
 
     def show_sound_selector(self, target_widget):
         """Show a dialog to select a sound file"""
-        # Initialize pygame mixer
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Sound")
         dialog.resize(800, 500)
@@ -2135,8 +2673,10 @@ class EntityToolGUI(QMainWindow):
         search_box.setPlaceholderText("Search sounds...")
         layout.addWidget(search_box)
         
-        # Sound list
-        sound_list = QListWidget()
+        # Sound list, filled through a model so a search is a single reset
+        sound_model = EntityListModel(dialog)
+        sound_list = _batched_list(QListView())
+        sound_list.setModel(sound_model)
         layout.addWidget(sound_list)
         
         # Playback controls
@@ -2151,69 +2691,56 @@ class EntityToolGUI(QMainWindow):
         # Audio playback state
         audio_state = {
             'playing': False,
-            'sound': None
+            'sound': None,
+            'channel': None
         }
         
-        def get_sound_files():
-            """Get all .ogg files from mod and base game"""
-            sound_files = {'mod': set(), 'base_game': set()}
-            
-            # Get mod sounds
-            if self.current_folder:
-                sound_dir = self.current_folder / "sounds"
-                if sound_dir.exists():
-                    for file_path in sound_dir.rglob("*.ogg"):
-                        rel_path = file_path.relative_to(sound_dir)
-                        sound_files['mod'].add(str(rel_path).replace('\\', '/'))
-            
-            # Get base game sounds
-            if self.base_game_folder:
-                sound_dir = self.base_game_folder / "sounds"
-                if sound_dir.exists():
-                    for file_path in sound_dir.rglob("*.ogg"):
-                        rel_path = file_path.relative_to(sound_dir)
-                        rel_path_str = str(rel_path).replace('\\', '/')
-                        if rel_path_str not in sound_files['mod']:
-                            sound_files['base_game'].add(rel_path_str)
-            
-            return sound_files
+        def check_playback():
+            """Reset the controls once the playing sound has finished"""
+            channel = audio_state['channel']
+            if channel is not None and channel.get_busy():
+                return
+            playback_timer.stop()
+            if audio_state['playing']:  # If not stopped manually
+                audio_state['playing'] = False
+                audio_state['channel'] = None
+                play_button.setEnabled(True)
+                stop_button.setEnabled(False)
+        
+        # Playback is polled from the GUI thread, so the buttons are only touched there
+        playback_timer = QTimer(dialog)
+        playback_timer.setInterval(200)
+        playback_timer.timeout.connect(check_playback)
+        
+        # The sound folders are walked once and reused until they change
+        sound_files = self.get_sound_files()
+            
+        # Sorted (path, lower-cased path) pairs, built once per change of the sound folders
+        mod_entries = sound_files['mod']
+        base_entries = sound_files['base_game']
+        
+        # Full paths with extension of the listed sounds, one per model row
+        shown_paths = []
             
         def update_sound_list(search=""):
-            sound_list.clear()
             search = search.lower()
-            sound_files = get_sound_files()
-            
-            # Add mod sounds first
-            for sound in sorted(sound_files['mod']):
-                if search in sound.lower():
-                    # Strip .ogg extension for display
-                    display_name = str(Path(sound).with_suffix(''))
-                    item = QListWidgetItem(display_name)
-                    # Store full path with extension as data
-                    item.setData(Qt.ItemDataRole.UserRole, sound)
-                    sound_list.addItem(item)
-            
-            # Then add base game sounds
-            for sound in sorted(sound_files['base_game']):
-                if search in sound.lower():
-                    # Strip .ogg extension for display
-                    display_name = str(Path(sound).with_suffix(''))
-                    item = QListWidgetItem(display_name)
-                    # Store full path with extension as data
-                    item.setData(Qt.ItemDataRole.UserRole, sound)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    sound_list.addItem(item)
+            
+            # Mod sounds first, then base game sounds
+            mod_sounds = [sound for sound, sound_lower in mod_entries if search in sound_lower]
+            base_sounds = [sound for sound, sound_lower in base_entries if search in sound_lower]
+            shown_paths[:] = mod_sounds + base_sounds
+            # Strip .ogg extension for display
+            sound_model.set_rows([str(Path(sound).with_suffix('')) for sound in mod_sounds],
+                                 [str(Path(sound).with_suffix('')) for sound in base_sounds])
         
         def play_sound():
-            if not sound_list.currentItem():
+            current = sound_list.currentIndex()
+            if not current.isValid():
                 return
                 
-            # Get full path with extension from item data
-            sound_path = sound_list.currentItem().data(Qt.ItemDataRole.UserRole)
-            is_base_game = sound_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            # Get full path with extension for the current row
+            sound_path = shown_paths[current.row()]
+            is_base_game = sound_model.is_base_game(current.row())
             
             # Get full path
             base_dir = self.base_game_folder if is_base_game else self.current_folder
@@ -2223,25 +2750,18 @@ class EntityToolGUI(QMainWindow):
                 try:
                     # Stop any existing playback
                     stop_sound()
+                    pygame = _get_mixer()
                     
                     # Load and play the sound
                     audio_state['sound'] = pygame.mixer.Sound(str(full_path))
-                    audio_state['sound'].play()
+                    audio_state['channel'] = audio_state['sound'].play()
                     audio_state['playing'] = True
                     
                     play_button.setEnabled(False)
                     stop_button.setEnabled(True)
                     
                     # Start a timer to check when playback is done
-                    def check_playback():
-                        while audio_state['playing'] and pygame.mixer.get_busy():
-                            pygame.time.wait(100)
-                        if audio_state['playing']:  # If not stopped manually
-                            audio_state['playing'] = False
-                            play_button.setEnabled(True)
-                            stop_button.setEnabled(False)
-                    
-                    threading.Thread(target=check_playback, daemon=True).start()
+                    playback_timer.start()
                     
                 except Exception as e:
                     print(f"Error playing sound: {str(e)}")
@@ -2250,15 +2770,18 @@ class EntityToolGUI(QMainWindow):
                     stop_button.setEnabled(False)
         
         def stop_sound():
+            playback_timer.stop()
             if audio_state['sound']:
                 audio_state['sound'].stop()
             audio_state['playing'] = False
             audio_state['sound'] = None
+            audio_state['channel'] = None
             play_button.setEnabled(True)
             stop_button.setEnabled(False)
         
-        # Connect signals
-        search_box.textChanged.connect(update_sound_list)
+        # Connect signals; typing restarts the timer, so a burst of keystrokes rebuilds the list once
+        search_timer = _debounce(dialog, lambda: update_sound_list(search_box.text()))
+        search_box.textChanged.connect(lambda _: search_timer.start())
         play_button.clicked.connect(play_sound)
         stop_button.clicked.connect(stop_sound)
         
@@ -2273,23 +2796,24 @@ class EntityToolGUI(QMainWindow):
         layout.addLayout(button_box)
         
         def on_item_selected():
-            if sound_list.currentItem():
+            current = sound_list.currentIndex()
+            if current.isValid():
                 stop_sound()  # Stop any playing sound
                 # Use display name (without extension) for selection
-                new_value = sound_list.currentItem().text()
+                new_value = sound_model.row_text(current.row())
                 self.on_select_value(target_widget, new_value)
                 dialog.accept()
         
-        def on_item_double_clicked(item):
+        def on_item_double_clicked(index):
             on_item_selected()
         
         def on_current_item_changed(current, previous):
-            select_btn.setEnabled(current is not None)
-            play_button.setEnabled(current is not None)
+            select_btn.setEnabled(current.isValid())
+            play_button.setEnabled(current.isValid())
         
         # Connect selection signals
-        sound_list.currentItemChanged.connect(on_current_item_changed)
-        sound_list.itemDoubleClicked.connect(on_item_double_clicked)
+        sound_list.selectionModel().currentChanged.connect(on_current_item_changed)
+        sound_list.doubleClicked.connect(on_item_double_clicked)
         select_btn.clicked.connect(on_item_selected)
         cancel_btn.clicked.connect(dialog.reject)
         
@@ -2299,10 +2823,8 @@ class EntityToolGUI(QMainWindow):
         # Initial population
         update_sound_list()
         dialog.exec()
-        
-        # Clean up pygame mixer
-        pygame.mixer.quit()
 
+    @pyqtSlot()
     def show_add_player_dialog(self):
         """Show dialog to create a new player by copying an existing one"""
         if not self.current_folder:
@@ -2319,32 +2841,36 @@ class EntityToolGUI(QMainWindow):
         search_box.setPlaceholderText("Search players...")
         layout.addWidget(search_box)
 
-        # Player list
-        player_list = QListWidget()
+        # Player list, filled through a model so a search is a single reset
+        player_model = EntityListModel(dialog)
+        player_list = _batched_list(QListView())
+        player_list.setModel(player_model)
         layout.addWidget(player_list)
 
+        # (id, lower-cased id) pairs, lower-cased once so searching does not redo it per keystroke
+        players = {}
+
+        def load_players():
+            # The file index already holds the sorted mod ids and the base game ids the mod does not override
+            mod_ids, base_only_ids = self.get_file_index('player')
+            players['mod'] = [(player_id, player_id.lower()) for player_id in mod_ids]
+            players['base_game'] = [(player_id, player_id.lower()) for player_id in base_only_ids]
+
         def update_player_list(search=""):
-            player_list.clear()
             search = search.lower()
 
-            # Add mod players first
-            for player_id in sorted(self.manifest_data['mod'].get('player', {})):
-                if search in player_id.lower():
-                    item = QListWidgetItem(player_id)
-                    player_list.addItem(item)
-
-            # Then add base game players
-            for player_id in sorted(self.manifest_data['base_game'].get('player', {})):
-                if (player_id not in self.manifest_data['mod'].get('player', {}) and 
-                    search in player_id.lower()):
-                    item = QListWidgetItem(player_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    player_list.addItem(item)
-
-        search_box.textChanged.connect(update_player_list)
+            # Mod players first
+            mod_players = [player_id for player_id, player_lower in players['mod'] if search in player_lower]
+
+            # Then base game players
+            base_players = [player_id for player_id, player_lower in players['base_game'] if search in player_lower]
+            player_model.set_rows(mod_players, base_players)
+
+        load_players()
+
+        # Typing restarts the timer, so a burst of keystrokes rebuilds the list once
+        search_timer = _debounce(dialog, lambda: update_player_list(search_box.text()))
+        search_box.textChanged.connect(lambda _: search_timer.start())
         update_player_list()  # Initial population
 
         # Buttons
@@ -2360,12 +2886,18 @@ class EntityToolGUI(QMainWindow):
         button_box.addWidget(cancel_btn)
         layout.addLayout(button_box)
 
+        def current_row():
+            """Row of the current player, or -1 when there is none"""
+            current = player_list.currentIndex()
+            return current.row() if current.isValid() else -1
+
         def on_copy():
-            if not player_list.currentItem():
+            row = current_row()
+            if row < 0:
                 return
 
-            source_file = player_list.currentItem().text()
-            is_base_game = player_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            source_file = player_model.row_text(row)
+            is_base_game = player_model.is_base_game(row)
 
             # Show copy dialog
             copy_dialog = QDialog(dialog)
@@ -2448,11 +2980,12 @@ class EntityToolGUI(QMainWindow):
             copy_dialog.exec()
 
         def on_delete():
-            if not player_list.currentItem():
+            row = current_row()
+            if row < 0:
                 return
 
-            player_id = player_list.currentItem().text()
-            is_base_game = player_list.currentItem().foreground().color().getRgb()[:3] == (150, 150, 150)
+            player_id = player_model.row_text(row)
+            is_base_game = player_model.is_base_game(row)
 
             if is_base_game:
                 QMessageBox.warning(dialog, "Error", "Cannot delete base game players")
@@ -2478,27 +3011,28 @@ class EntityToolGUI(QMainWindow):
                 # Update the manifest file
                 manifest_file = self.current_folder / "entities" / "player.entity_manifest"
                 if manifest_file.exists():
-                    with open(manifest_file, 'r', encoding='utf-8') as f:
-                        manifest_data = json.load(f)
+                    manifest_data = get_manifest(manifest_file)
                     if "ids" in manifest_data and player_id in manifest_data["ids"]:
-                        manifest_data["ids"].remove(player_id)
-                        with open(manifest_file, 'w', encoding='utf-8') as f:
-                            json.dump(manifest_data, f, indent=4)
+                        # Copy before modifying, the cached manifest is shared
+                        manifest_data = {**manifest_data, "ids": [x for x in manifest_data["ids"] if x != player_id]}
+                        _write_json(manifest_file, manifest_data)
+                        cache_manifest(manifest_file, manifest_data)
 
                 # Remove from GUI's manifest data
                 if 'player' in self.manifest_data['mod']:
                     self.manifest_data['mod']['player'].pop(player_id, None)
+                    self.invalidate_file_index('player')
 
                 # Remove from player selector
                 index = self.player_selector.findText(player_id)
                 if index >= 0:
                     self.player_selector.removeItem(index)
 
-                # Remove from list and select another item
-                row = player_list.row(player_list.currentItem())
-                player_list.takeItem(row)
-                if player_list.count() > 0:
-                    player_list.setCurrentRow(min(row, player_list.count() - 1))
+                # Refresh the list and select another item
+                load_players()
+                update_player_list(search_box.text())
+                if player_model.rowCount() > 0:
+                    player_list.setCurrentIndex(player_model.index(min(row, player_model.rowCount() - 1)))
 
                 # Close dialog
                 dialog.accept()
@@ -2507,11 +3041,11 @@ class EntityToolGUI(QMainWindow):
                 QMessageBox.warning(dialog, "Error", f"Failed to delete player: {str(e)}")
 
         def on_current_item_changed(current, previous):
-            if current:
-                is_base_game = current.foreground().color().getRgb()[:3] == (150, 150, 150)
+            if current.isValid():
+                is_base_game = player_model.is_base_game(current.row())
                 delete_btn.setEnabled(not is_base_game)
 
-        player_list.currentItemChanged.connect(on_current_item_changed)
+        player_list.selectionModel().currentChanged.connect(on_current_item_changed)
         delete_btn.clicked.connect(on_delete)
         copy_btn.clicked.connect(on_copy)
         cancel_btn.clicked.connect(dialog.reject)
@@ -2532,10 +3066,27 @@ class EntityToolGUI(QMainWindow):
         """Get the current value from command stack if available, otherwise return default"""
         if not file_path or not path:
             return default_value
-            
+        
+        # Lookups are cached until the command stack's data next changes, so building a
+        # schema view walks each path once
+        generation = self.command_stack.data_generation
+        if self._command_value_generation != generation:
+            self._command_value_cache.clear()
+            self._command_value_generation = generation
+        key = (file_path, tuple(path))
+        try:
+            value = self._command_value_cache[key]
+        except KeyError:
+            value = self._command_value_cache[key] = self._lookup_command_stack_value(file_path, path)
+        except TypeError:  # Unhashable path element
+            value = self._lookup_command_stack_value(file_path, path)
+        return default_value if value is _MISSING else value
+
+    def _lookup_command_stack_value(self, file_path: Path, path: list) -> any:
+        """Return the value at path in the command stack's data for file_path, or _MISSING"""
         data = self.command_stack.get_file_data(file_path)
         if not data:
-            return default_value
+            return _MISSING
             
         # Navigate through the path to get the value
         current = data
@@ -2546,57 +3097,80 @@ class EntityToolGUI(QMainWindow):
                 elif isinstance(current, list) and isinstance(key, int) and key < len(current):
                     current = current[key]
                 else:
-                    return default_value
+                    return _MISSING
                     
             if isinstance(current, dict):
-                return current.get(path[-1], default_value)
+                return current.get(path[-1], _MISSING)
             elif isinstance(current, list) and isinstance(path[-1], int) and path[-1] < len(current):
                 return current[path[-1]]
-            return default_value
+            return _MISSING
         except Exception:
-            return default_value
+            return _MISSING
 
     def save_changes(self):
         """Save all changes and return True if successful"""
+        # Apply a localized text edit still waiting on its timer, so it is part of this save
+        if self.text_edit_timer.isActive():
+            self.text_edit_timer.stop()
+            self.on_text_edit_timer_timeout()
+        
         if not self.command_stack.has_unsaved_changes():
             logging.info("No unsaved changes to save")
             return True
             
+        # Let any background command writes finish and restore their formatting
+        self.command_stack.flush_pretty()
+        
         # Get all modified files
         modified_files = self.command_stack.get_modified_files()
-        print(f"Found {len(modified_files)} modified files to save")
-        print(f"Modified files list: {modified_files}")
+        logging.info("Found %d modified files to save", len(modified_files))
+        logging.debug("Modified files list: %s", modified_files)
         
         success = True
+        failed = []  # Files whose write raised, appended from the worker threads
+        saved_data = {}  # {file path: the command stack's stored data it is saved from}
+        
+        def save_file(file_path, raw):
+            try:
+                _atomic_write_bytes(file_path, raw)
+                logging.debug("Saved file: %s", file_path)
+            except Exception as e:
+                logging.error("Failed to save file %s: %s", file_path, e)
+                failed.append(file_path)
+        
+        writes = []
         for file_path in modified_files:
-            print(f"Processing file for save: {file_path}")
+            logging.debug("Processing file for save: %s", file_path)
             
             # Get the latest data from the command stack
             data = self.command_stack.get_file_data(file_path)
             
             if not data:
-                print(f"No data found in command stack for file: {file_path}")
-                success = False
-                continue
-                    
-            # Save the file
-            print(f"Attempting to save file: {file_path}")
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                print(f"Successfully saved file: {file_path}")
-            except Exception as e:
-                print(f"Failed to save file {file_path}: {str(e)}")
+                logging.error("No data found in command stack for file: %s", file_path)
                 success = False
                 continue
+            
+            # Serialized here on the GUI thread: the data shares its nested objects with the
+            # command stack, so the worker threads only ever see the finished bytes
+            saved_data[file_path] = self.command_stack.file_data.get(file_path)
+            writes.append((file_path, json.dumps(data, indent=4).encode('ascii')))
+        
+        # The files are independent, so they are written side by side off the GUI thread.
+        # No events are processed meanwhile, so nothing can edit a file before it is marked saved
+        list(_ENTITY_IO_POOL.map(lambda write: save_file(*write), writes))
+        for file_path in failed:
+            saved_data.pop(file_path, None)
+        if failed:
+            success = False
+        
+        # Saved files get a new mtime anyway, but drop the cached file contents explicitly
+        self._file_cache.clear()
                 
         # Update UI and command stack state
         if success:
             self.status_label.setText("All changes saved")
             self.status_label.setProperty("status", "success")
             logging.info("All files saved successfully")
-            # Mark all changes as saved in command stack
-            self.command_stack.mark_all_saved()
         else:
             self.status_label.setText("Error saving some changes")
             self.status_label.setProperty("status", "error")
@@ -2604,9 +3178,11 @@ class EntityToolGUI(QMainWindow):
         self.status_label.style().unpolish(self.status_label)
         self.status_label.style().polish(self.status_label)
         
+        # Mark the written files as saved in command stack
+        self.command_stack.mark_saved(saved_data)
+        
         # Update save button state
         self.update_save_button()
-        print(f"Save button enabled: {self.command_stack.has_unsaved_changes()}")
 
         return success
         
@@ -2624,12 +3200,12 @@ class EntityToolGUI(QMainWindow):
 
     def update_data_value(self, data_path: list, new_value: any):
         """Update a value in the data structure using its path"""
-        print(f"Updating data value at path {data_path} to {new_value}")
+        logging.debug("Updating data value at path %s to %s", data_path, new_value)
 
         if not data_path:
             # Empty path - replace entire data structure
             self.current_data = new_value
-            print(f"Replaced entire data structure with new value")
+            logging.debug("Replaced entire data structure with new value")
             return
         
         if len(data_path) == 1:
@@ -2639,38 +3215,41 @@ class EntityToolGUI(QMainWindow):
                     # Remove property if new_value is None
                     if data_path[0] in self.current_data:
                         del self.current_data[data_path[0]]
-                        print(f"Removed root property {data_path[0]}")
+                        logging.debug("Removed root property %s", data_path[0])
                 else:
                     # Add or update property
                     self.current_data[data_path[0]] = new_value
-                    print(f"Updated root property {data_path[0]} to {new_value}")
+                    logging.debug("Updated root property %s to %s", data_path[0], new_value)
             return
         
         current = self.current_data
-        for i, key in enumerate(data_path[:-1]):
-            print(f"Traversing path element {i}: {key}")
+        for i, (key, next_key) in enumerate(zip(data_path, data_path[1:])):
+            logging.debug("Traversing path element %s: %s", i, key)
+            # Missing containers are created to match the type of the next path element
+            container_type = dict if isinstance(next_key, str) else list
             if isinstance(current, dict):
+                # The container is only built when the key is missing
                 if key not in current:
-                    current[key] = {} if isinstance(data_path[i + 1], str) else []
-                    print(f"Created new dict/list for key {key}")
+                    current[key] = container_type()
                 current = current[key]
             elif isinstance(current, list):
-                while len(current) <= key:
-                    current.append({} if isinstance(data_path[i + 1], str) else [])
-                    print(f"Extended list to accommodate index {key}")
+                if len(current) <= key:
+                    current.extend(container_type() for _ in range(key - len(current) + 1))
+                    logging.debug("Extended list to accommodate index %s", key)
                 current = current[key]
         
         if data_path:
             if isinstance(current, dict):
-                print(f"Setting dict key {data_path[-1]} to {new_value}")
+                logging.debug("Setting dict key %s to %s", data_path[-1], new_value)
                 current[data_path[-1]] = new_value
             elif isinstance(current, list):
                 while len(current) <= data_path[-1]:
                     current.append(None)
-                    print(f"Extended list to accommodate final index {data_path[-1]}")
-                print(f"Setting list index {data_path[-1]} to {new_value}")
+                    logging.debug("Extended list to accommodate final index %s", data_path[-1])
+                logging.debug("Setting list index %s to %s", data_path[-1], new_value)
                 current[data_path[-1]] = new_value
 
+    @pyqtSlot(str)
     def on_player_selected(self, player_name: str):
         """Handle player selection from dropdown"""
         if not player_name or not self.current_folder:
@@ -2693,32 +3272,40 @@ class EntityToolGUI(QMainWindow):
         self.player_layout.addWidget(schema_view)
         
         # Units Tab
-        # Clear the lists
-        self.units_list.clear()
-        self.strikecraft_list.clear()
-        # Don't clear all_units_list as it's populated from folder load
-            
-        # Add buildable units
-        if "buildable_units" in self.current_data:
-            for unit_id in sorted(self.current_data["buildable_units"]):
-                item = QListWidgetItem(unit_id)
-                # Check if unit exists in mod folder first
-                mod_file = self.current_folder / "entities" / f"{unit_id}.unit"
-                # Style as base game if it doesn't exist in mod folder
-                if (not mod_file.exists() and self.base_game_folder and 
-                    unit_id in self.manifest_data['base_game'].get('unit', {})):
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                self.units_list.addItem(item)
-        
-        # Add buildable strikecraft
+        # Repaint the lists once, after they are refilled, and skip the selection
+        # signals the intermediate states would emit
+        for list_widget in (self.units_list, self.strikecraft_list):
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
+        try:
+            # Clear the lists
+            self.units_list.clear()
+            self.strikecraft_list.clear()
+            # Don't clear all_units_list as it's populated from folder load
+            
+            # Add buildable units, all rows in one call
+            if "buildable_units" in self.current_data:
+                unit_ids = sorted(self.current_data["buildable_units"])
+                self.units_list.addItems(unit_ids)
+                # Check if unit exists in mod folder first, against one cached listing of the folder.
+                # Names are compared lower-cased, as the game does on Windows
+                mod_files = {name.lower() for name in self.list_folder_files(self.current_folder / "entities", ".unit")}
+                base_units = self.manifest_data['base_game'].get('unit', {})
+                for row, unit_id in enumerate(unit_ids):
+                    # Style as base game if it doesn't exist in mod folder
+                    if (f"{unit_id}.unit".lower() not in mod_files and self.base_game_folder and 
+                        unit_id in base_units):
+                        self.style_base_game_item(self.units_list.item(row))
+        
+            # Add buildable strikecraft
+            if "buildable_strikecraft" in self.current_data:
+                self.strikecraft_list.addItems(sorted(self.current_data["buildable_strikecraft"]))
+        finally:
+            for list_widget in (self.units_list, self.strikecraft_list):
+                list_widget.blockSignals(False)
+                list_widget.setUpdatesEnabled(True)
+        
         if "buildable_strikecraft" in self.current_data:
-            for unit_id in sorted(self.current_data["buildable_strikecraft"]):
-                item = QListWidgetItem(unit_id)
-                self.strikecraft_list.addItem(item)
-            
             # Clear all detail panels
             self.clear_layout(self.unit_details_layout)
             self.clear_layout(self.weapon_details_layout)
@@ -2747,13 +3334,14 @@ class EntityToolGUI(QMainWindow):
 
         # Add refresh button on the right side
         refresh_btn = QPushButton()
-        refresh_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "refresh.png")))
+        refresh_btn.setIcon(_icon("refresh.png"))
         refresh_btn.setToolTip('Refresh Research View')
         refresh_btn.setFixedSize(18, 18)
         refresh_btn.clicked.connect(lambda: self.refresh_research_view())
         domain_layout.addWidget(refresh_btn)
 
         # Create research tree view
+        from research_view import ResearchTreeView
         tree_view = ResearchTreeView()
         tree_view.node_clicked.connect(self.load_research_subject)
         tree_view.node_delete_requested.connect(lambda subject_id: self.delete_research_subject(subject_id))
@@ -2792,7 +3380,10 @@ class EntityToolGUI(QMainWindow):
             subjects_by_tier = {}
             for subject_id in research_data["research_subjects"]:
                 subject_file = self.current_folder / "entities" / f"{subject_id}.research_subject"
-                subject_data, is_base_game = self.load_file(subject_file)
+                # Data held by the command stack is newer than the file, which may still be being written
+                subject_data, is_base_game = self.command_stack.file_data.get(subject_file), False
+                if subject_data is None:
+                    subject_data, is_base_game = self.load_file(subject_file)
                 
                 if subject_data:
                     tier = subject_data.get("tier", 0)  # Default to tier 0
@@ -2945,11 +3536,11 @@ class EntityToolGUI(QMainWindow):
         # Rest of existing code... 
 
     def on_unit_selected(self, item):
-        """Handle unit selection from the list"""
+        """Handle unit selection from the list (a list item or a model index)"""
         if not self.current_folder:
             return
             
-        unit_id = item.text()
+        unit_id = item.data(Qt.ItemDataRole.DisplayRole)
         unit_file = self.current_folder / "entities" / f"{unit_id}.unit"
         
         try:
@@ -2989,13 +3580,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.unit_details_layout.addWidget(error_label)
 
-    def on_item_selected(self, item):
+    @pyqtSlot(QModelIndex)
+    def on_item_selected(self, index):
         """Handle unit item selection from the list"""
         if not self.current_folder:
             return
             
-        item_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        item_id = self.items_model.row_text(index.row())
+        is_base_game = self.items_model.is_base_game(index.row())
         item_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{item_id}.unit_item"
         
         try:
@@ -3018,13 +3610,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.item_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_ability_selected(self, item):
         """Handle ability selection from the list"""
         if not self.current_folder:
             return
             
         ability_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         ability_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{ability_id}.ability"
         
         try:
@@ -3047,13 +3640,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.ability_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_action_selected(self, item):
         """Handle action data source selection from the list"""
         if not self.current_folder:
             return
             
         action_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         action_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{action_id}.action_data_source"
         
         try:
@@ -3076,13 +3670,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.action_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_buff_selected(self, item):
         """Handle buff selection from the list"""
         if not self.current_folder:
             return
             
         buff_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         buff_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{buff_id}.buff"
         
         try:
@@ -3105,13 +3700,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.buff_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_formation_selected(self, item):
         """Handle formation selection from the list"""
         if not self.current_folder:
             return
             
         formation_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         formation_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{formation_id}.formation"
         
         try:
@@ -3134,13 +3730,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.formation_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_pattern_selected(self, item):
         """Handle flight pattern selection from the list"""
         if not self.current_folder:
             return
             
         pattern_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         pattern_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{pattern_id}.flight_pattern"
         
         try:
@@ -3163,13 +3760,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.pattern_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_reward_selected(self, item):
         """Handle NPC reward selection from the list"""
         if not self.current_folder:
             return
             
         reward_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         reward_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{reward_id}.npc_reward"
         
         try:
@@ -3192,13 +3790,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.reward_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_exotic_selected(self, item):
         """Handle exotic selection from the list"""
         if not self.current_folder:
             return
             
         exotic_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         exotic_file = (self.base_game_folder if is_base_game else self.current_folder) / "entities" / f"{exotic_id}.exotic"
         
         try:
@@ -3221,13 +3820,14 @@ class EntityToolGUI(QMainWindow):
             error_label.setStyleSheet("color: red;")
             self.exotic_details_layout.addWidget(error_label)
 
+    @pyqtSlot(QListWidgetItem)
     def on_uniform_selected(self, item):
         """Handle uniform selection from the list"""
         if not self.current_folder:
             return
             
         uniform_id = item.text()
-        is_base_game = item.foreground().color().getRgb()[:3] == (150, 150, 150)  # Check if it's a base game item
+        is_base_game = item.data(BASE_GAME_ROLE) is True  # Check if it's a base game item
         uniform_file = (self.base_game_folder if is_base_game else self.current_folder) / "uniforms" / f"{uniform_id}.uniforms"
         
         try:
@@ -3288,7 +3888,8 @@ class EntityToolGUI(QMainWindow):
             schema_name = file_type.replace("_", "-") + "-schema"
             print(f"Looking for schema: {schema_name}")
             
-        if schema_name not in self.schemas:
+        schema = self._get_schema(schema_name)
+        if schema is None:
             print(f"Schema not found for {schema_name}, using generic schema")
             # Create a generic schema based on the data structure
             def create_schema_for_value(value):
@@ -3324,8 +3925,7 @@ class EntityToolGUI(QMainWindow):
             self.current_schema = create_schema_for_value(display_data)
         else:
             print(f"Found schema: {schema_name}")
-            # Get the schema and resolve any top-level references
-            schema = self.schemas[schema_name]
+            # Resolve any top-level references
             if isinstance(schema, dict) and "$ref" in schema:
                 schema = self.resolve_schema_references(schema)
             self.current_schema = schema
@@ -3465,7 +4065,7 @@ class EntityToolGUI(QMainWindow):
                     title_layout.addStretch()
                     
                     refresh_btn = QPushButton()
-                    refresh_btn.setIcon(QIcon(str(Path(__file__).parent / "icons" / "refresh.png")))
+                    refresh_btn.setIcon(_icon("refresh.png"))
                     refresh_btn.setToolTip('Refresh View')
                     refresh_btn.setFixedSize(18, 18)
                     refresh_btn.clicked.connect(lambda: self.refresh_schema_view(file_path))
@@ -3628,7 +4228,10 @@ class EntityToolGUI(QMainWindow):
         if schema_type == "object":
             # Add any properties that are in the data but not in the schema properties
             # This handles cases like conditional properties that didn't get processed above
-            if "properties" in schema:
+            # Resolved schemas are cached and shared between views, so the inferred entries go
+            # into a copy of properties rather than the schema itself
+            if "properties" in schema and any(key not in schema["properties"] and key != "$schema" for key in data):
+                schema = {**schema, "properties": dict(schema["properties"])}
                 for key in data.keys():
                     if key not in schema["properties"] and key != "$schema":
                         # Create a generic schema for this property based on its type
@@ -3647,9 +4250,7 @@ class EntityToolGUI(QMainWindow):
                             schema["properties"][key] = {"type": "object", "properties": {}}
             # Create container for object properties
             container = QWidget()
-            container_layout = QVBoxLayout(container)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(0)
+            container_layout = _vbox(container, spacing=0)
             
             # If data is None, create an empty dict with required properties
             if data is None:
@@ -3660,7 +4261,7 @@ class EntityToolGUI(QMainWindow):
 
             # Make sure properties dictionary exists
             if "properties" not in schema:
-                schema["properties"] = {}
+                schema = {**schema, "properties": {}}
 
             properties = schema.get("properties", {}).items()
             sorted_properties = sorted(properties, 
@@ -3705,6 +4306,7 @@ class EntityToolGUI(QMainWindow):
                             # Add context menu to label
                             label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
                             label.setProperty("data_path", prop_path)
+                            label.setProperty("is_property_label", True)
                             label.customContextMenuRequested.connect(
                                 lambda pos, w=label, v=value: self.show_context_menu(w, pos, v)
                             )
@@ -3720,8 +4322,7 @@ class EntityToolGUI(QMainWindow):
                         else:
                             # Create collapsible section for complex types
                             group_widget = QWidget()
-                            group_layout = QVBoxLayout(group_widget)
-                            group_layout.setContentsMargins(0, 0, 0, 0)
+                            group_layout = _vbox(group_widget)
                             
                             # Create collapsible button
                             toggle_btn = QToolButton()
@@ -3738,6 +4339,7 @@ class EntityToolGUI(QMainWindow):
                             # Store object data and path for context menu
                             toggle_btn.setProperty("data_path", prop_path)
                             toggle_btn.setProperty("original_value", value)
+                            toggle_btn.setProperty("is_property_label", True)
                             
                             # Add context menu to the button
                             toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -3747,8 +4349,7 @@ class EntityToolGUI(QMainWindow):
                             
                             # Create content widget
                             content = QWidget()
-                            content_layout = QVBoxLayout(content)
-                            content_layout.setContentsMargins(20, 0, 0, 0)
+                            content_layout = _vbox(content, margins=(20, 0, 0, 0))
                             content_layout.addWidget(widget)
                             
                             content.setVisible(False)  # Initially collapsed
@@ -3777,9 +4378,7 @@ class EntityToolGUI(QMainWindow):
         elif schema_type == "array":
             # Create collapsible container for the entire array
             container = QWidget()
-            container_layout = QVBoxLayout(container)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setSpacing(0)
+            container_layout = _vbox(container, spacing=0)
             
             # Create collapsible button for the array
             toggle_btn = QToolButton()
@@ -3799,6 +4398,7 @@ class EntityToolGUI(QMainWindow):
             # Store array data and path for context menu
             toggle_btn.setProperty("data_path", path)
             toggle_btn.setProperty("original_value", data)
+            toggle_btn.setProperty("is_property_label", True)
 
             # Add context menu to the button
             toggle_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -3810,9 +4410,7 @@ class EntityToolGUI(QMainWindow):
             
             # Create content widget for array items
             content = QWidget()
-            content_layout = QVBoxLayout(content)
-            content_layout.setContentsMargins(20, 0, 0, 0)  # Add left margin for indentation
-            content_layout.setSpacing(0)
+            content_layout = _vbox(content, margins=(20, 0, 0, 0), spacing=0)  # Add left margin for indentation
             content_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)  # Align content to the left and top
             content.setVisible(False)  # Initially collapsed
             
@@ -4001,9 +4599,7 @@ class EntityToolGUI(QMainWindow):
             # Special handling for arrays and objects
             if isinstance(value, list):
                 container = QWidget()
-                layout = QVBoxLayout(container)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(2)
+                layout = _vbox(container, spacing=2)
                 
                 print(f"Processing array with schema: {schema}")
                 
@@ -4167,9 +4763,7 @@ class EntityToolGUI(QMainWindow):
                 print(f"Creating localized text widget for key: {value_str}")
                 # Create a container with both localized text and editable fields
                 container = QWidget()
-                layout = QVBoxLayout(container)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(4)
+                layout = _vbox(container, spacing=4)
                 
                 # Add editable field for the key
                 print(f"Creating key edit for: {value_str}")
@@ -4253,9 +4847,7 @@ class EntityToolGUI(QMainWindow):
             elif value_str in self.all_texture_files['mod'] or value_str in self.all_texture_files['base_game']:
                 # Handle texture references - create a container with both texture and editable field
                 container = QWidget()
-                layout = QVBoxLayout(container)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(4)
+                layout = _vbox(container, spacing=4)
                 
                 # Add texture preview
                 label = self.create_texture_label(value_str)
@@ -4298,7 +4890,7 @@ class EntityToolGUI(QMainWindow):
                     )
                 
                 # Install wheel event filter
-                combo.installEventFilter(self.wheel_filter)
+                combo.installEventFilter(_WHEEL_FILTER)
                 
                 # Store path and original value
                 combo.setProperty("data_path", path)
@@ -4351,7 +4943,7 @@ class EntityToolGUI(QMainWindow):
                 spin.valueChanged.connect(lambda value: self.on_spin_changed(spin, value))
             
             # Install wheel event filter
-            spin.installEventFilter(self.wheel_filter)
+            spin.installEventFilter(_WHEEL_FILTER)
             
             # Store path and original value
             spin.setProperty("data_path", path)
@@ -4389,7 +4981,7 @@ class EntityToolGUI(QMainWindow):
                 spin.valueChanged.connect(lambda value: self.on_spin_changed(spin, value))
             
             # Install wheel event filter
-            spin.installEventFilter(self.wheel_filter)
+            spin.installEventFilter(_WHEEL_FILTER)
             
             # Store path and original value
             spin.setProperty("data_path", path)
@@ -4659,26 +5251,22 @@ class EntityToolGUI(QMainWindow):
                 print(f"Using data from command stack for {entity_file}")
                 is_base_game = False
             else:
-                # Try mod folder first
-                if entity_file.exists():
-                    print(f"Loading referenced entity from mod folder: {entity_file}")
-                    with open(entity_file, 'r', encoding='utf-8') as f:
-                        entity_data = json.load(f)
-                        is_base_game = False
-                    print(f"Successfully loaded data for {entity_file}")
-                    print(f"Initial data for {entity_file}: {entity_data}")
+                # Try mod folder first. The file contents are cached with the selection handlers'
+                # load_file, so following a reference to a file seen before skips the read;
+                # each call parses a new copy, which the command stack may then modify
+                entity_data = self.read_json_cached(entity_file)
+                if entity_data is not None:
+                    print(f"Loaded referenced entity from mod folder: {entity_file}")
+                    is_base_game = False
                 
                 # Try base game folder if not found in mod folder
                 elif self.base_game_folder:
                     base_game_file = self.base_game_folder / "entities" / f"{entity_id}.{entity_type}"
-                    if base_game_file.exists():
-                        print(f"Loading referenced entity from base game: {base_game_file}")
-                        with open(base_game_file, 'r', encoding='utf-8') as f:
-                            entity_data = json.load(f)
-                            is_base_game = True
+                    entity_data = self.read_json_cached(base_game_file)
+                    if entity_data is not None:
+                        print(f"Loaded referenced entity from base game: {base_game_file}")
+                        is_base_game = True
                         entity_file = base_game_file
-                        print(f"Successfully loaded base game data for {entity_file}")
-                        print(f"Initial base game data for {entity_file}: {entity_data}")
                 
             if not entity_data:
                 error_msg = f"Could not find {entity_type} file: {entity_id}\n\n"
@@ -4764,10 +5352,9 @@ class EntityToolGUI(QMainWindow):
                 self.tab_widget.setCurrentIndex(items_tab)
                 
                 # Select the item in the list if it exists
-                for i in range(self.items_list.count()):
-                    if self.items_list.item(i).text() == entity_id:
-                        self.items_list.setCurrentRow(i)
-                        break
+                row = self.items_model.find_row(entity_id)
+                if row >= 0:
+                    self.items_list.setCurrentIndex(self.items_model.index(row))
                 
                 # Only clear and update the item panel content
                 while self.item_details_layout.count():
@@ -4941,11 +5528,10 @@ class EntityToolGUI(QMainWindow):
                         
                 # Finally check all units list
                 if not found:
-                    for i in range(self.all_units_list.count()):
-                        if self.all_units_list.item(i).text() == entity_id:
-                            self.all_units_list.setCurrentRow(i)
-                            found = True
-                            break
+                    row = self.all_units_model.find_row(entity_id)
+                    if row >= 0:
+                        self.all_units_list.setCurrentIndex(self.all_units_model.index(row))
+                        found = True
                 
                 # Only clear and update the unit panel content
                 while self.unit_details_layout.count():
@@ -5084,8 +5670,8 @@ class EntityToolGUI(QMainWindow):
         
         # Handle properties merging
         if "properties" in schema2:
-            if "properties" not in result:
-                result["properties"] = {}
+            # Copy rather than add to schema1's properties, which may belong to a cached schema
+            result["properties"] = dict(result.get("properties", {}))
             for prop_name, prop_schema in schema2["properties"].items():
                 result["properties"][prop_name] = prop_schema.copy()
         
@@ -5103,10 +5689,32 @@ class EntityToolGUI(QMainWindow):
         return result
 
     def resolve_schema_references(self, schema: dict) -> dict:
+        """Resolve schema references, reusing the result for a schema dict already resolved.
+        Local $defs come from current_schema, so it is part of the key; the entry holds both
+        dicts so their ids cannot be reused while it is cached. The result is shared between
+        callers and must not be modified in place"""
+        if not schema or not isinstance(schema, dict):
+            return schema
+        key = (id(schema), id(self.current_schema))
+        cached = self._resolved_schema_cache.get(key)
+        if cached is not None:
+            return cached[2]
+        resolved = self._resolve_schema_references(schema)
+        self._resolved_schema_cache[key] = (schema, self.current_schema, resolved)
+        return resolved
+
+    def sorted_schema_properties(self, properties: dict) -> list:
+        """Return a schema's properties.items() sorted by name. The sorted order is cached by the
+        tuple of property names, so a dict that gains or loses keys is sorted again"""
+        names = tuple(properties)
+        order = self._sorted_properties_cache.get(names)
+        if order is None:
+            order = sorted(names)
+            self._sorted_properties_cache[names] = order
+        return [(name, properties[name]) for name in order]
+
+    def _resolve_schema_references(self, schema: dict) -> dict:
             """Resolve schema references recursively, handling circular references"""
-            if not schema or not isinstance(schema, dict):
-                return schema
-            
             # Use a cache to avoid infinite recursion with circular references
             if not hasattr(self, '_ref_cache'):
                 self._ref_cache = {}
@@ -5133,7 +5741,8 @@ class EntityToolGUI(QMainWindow):
                     resolved = self.current_schema["$defs"][ref_path[1]]
                 else:
                     # Look through all loaded schemas
-                    for loaded_schema in self.schemas.values():
+                    for name in self.schema_files:
+                        loaded_schema = self._get_schema(name)
                         try:
                             resolved = loaded_schema
                             for part in ref_path:
@@ -5377,6 +5986,8 @@ class EntityToolGUI(QMainWindow):
         if not self.current_folder or not self.current_data or "research" not in self.current_data:
             return
             
+        from research_view import ResearchTreeView
+        
         # Find the current research view
         current_view = None
         if self.research_layout.count() > 0:
@@ -5432,7 +6043,10 @@ class EntityToolGUI(QMainWindow):
             subjects_by_tier = {}
             for subject_id in self.current_data["research"]["research_subjects"]:
                 subject_file = self.current_folder / "entities" / f"{subject_id}.research_subject"
-                subject_data, is_base_game = self.load_file(subject_file)
+                # Data held by the command stack is newer than the file, which may still be being written
+                subject_data, is_base_game = self.command_stack.file_data.get(subject_file), False
+                if subject_data is None:
+                    subject_data, is_base_game = self.load_file(subject_file)
                 
                 if subject_data:
                     tier = subject_data.get("tier", 0)  # Default to tier 0
@@ -5630,6 +6244,7 @@ class EntityToolGUI(QMainWindow):
             widget.setProperty("original_value", new_value)
             self.update_save_button()  # Update save button state
 
+    @pyqtSlot()
     def on_text_edit_timer_timeout(self):
         if self.current_text_edit and not self.current_text_edit.property("is_updating"):
             self.on_localized_text_changed(self.current_text_edit, self.current_text_edit.toPlainText())
@@ -5715,8 +6330,7 @@ class EntityToolGUI(QMainWindow):
         
         # Get the current data from the file
         try:
-            with open(text_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(text_file)
         except Exception:
             data = {}
             
@@ -5743,6 +6357,7 @@ class EntityToolGUI(QMainWindow):
             if language not in self.all_localized_strings['mod']:
                 self.all_localized_strings['mod'][language] = {}
             self.all_localized_strings['mod'][language][key] = text
+            self.invalidate_localized_indexes(language)
             
     def update_text_preserve_cursor(self, edit: QPlainTextEdit, value: str):
         """Update text in QPlainTextEdit while preserving cursor position and selection"""
@@ -5772,8 +6387,7 @@ class EntityToolGUI(QMainWindow):
             if not data:
                 # If no data in command stack, read from file
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _load_json(file_path)
                 except Exception:
                     data = {}
                 self.command_stack.update_file_data(file_path, data)
@@ -5801,9 +6415,8 @@ class EntityToolGUI(QMainWindow):
         # Get current data from command stack
         current_data = self.command_stack.get_file_data(file_path)
         if not current_data:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                current_data = json.load(f)
-                
+            current_data = _load_json(file_path)
+            
         # Navigate to the target object
         target = current_data
         if data_path:  # Only navigate if we have a path
@@ -5949,9 +6562,8 @@ class EntityToolGUI(QMainWindow):
         # Get current data from command stack
         current_data = self.command_stack.get_file_data(file_path)
         if not current_data:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                current_data = json.load(f)
-                
+            current_data = _load_json(file_path)
+            
         # Navigate to the target array
         array_data = current_data
         for part in data_path:
@@ -6027,8 +6639,7 @@ class EntityToolGUI(QMainWindow):
         # Get current data from command stack
         current_data = self.command_stack.get_file_data(file_path)
         if not current_data:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                current_data = json.load(f)
+            current_data = _load_json(file_path)
         
         # Get array path (everything except the last index)
         array_path = item_path[:-1]
@@ -6097,24 +6708,27 @@ class EntityToolGUI(QMainWindow):
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
+        # (id, lower-cased id, is_base_game) for every subject, mod subjects first, built once per dialog.
+        # Base game subjects the mod overrides are already left out of the file index
+        mod_ids, base_only_ids = self.get_file_index('research_subject')
+        subject_rows = ([(subject_id, subject_id.lower(), False) for subject_id in mod_ids] +
+                        [(subject_id, subject_id.lower(), True) for subject_id in base_only_ids])
+
         def update_subject_list(search=""):
             list_widget.clear()
             
-            # Add mod subjects first
-            for subject_id in sorted(self.manifest_data['mod'].get('research_subject', {})):
-                if search.lower() in subject_id.lower():
-                    item = QListWidgetItem(subject_id)
-                    list_widget.addItem(item)
-            
-            # Then add base game subjects
-            for subject_id in sorted(self.manifest_data['base_game'].get('research_subject', {})):
-                if search.lower() in subject_id.lower() and subject_id not in self.manifest_data['mod'].get('research_subject', {}):
-                    item = QListWidgetItem(subject_id)
-                    item.setForeground(QColor(150, 150, 150))
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
-                    list_widget.addItem(item)
+            search = search.lower()
+            list_widget.setUpdatesEnabled(False)
+            try:
+                matches = [(subject_id, is_base_game) for subject_id, subject_lower, is_base_game in subject_rows
+                           if search in subject_lower]
+                # Add all rows in one call, then style the base game subjects in place
+                list_widget.addItems([subject_id for subject_id, _ in matches])
+                for row, (_, is_base_game) in enumerate(matches):
+                    if is_base_game:
+                        self.style_base_game_item(list_widget.item(row))
+            finally:
+                list_widget.setUpdatesEnabled(True)
 
         def get_research_fields():
             """Get available research fields from the current player file"""
@@ -6411,9 +7025,11 @@ class EntityToolGUI(QMainWindow):
         menu = QMenu()
         
         # Only show options if an item is selected
-        if list_widget.currentItem():
-            file_id = list_widget.currentItem().text()
-            is_mod_version = not list_widget.currentItem().font().italic()
+        current = list_widget.currentIndex()
+        if current.isValid():
+            file_id = current.data(Qt.ItemDataRole.DisplayRole)
+            font = current.data(Qt.ItemDataRole.FontRole)
+            is_mod_version = not (font and font.italic())
             has_base_game_version = False
 
             # Check if there's a base game version
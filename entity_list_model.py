@@ -0,0 +1,75 @@
+from typing import List
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush, QFont
+
+# Item data role holding True for rows that show a base game file
+BASE_GAME_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class EntityListModel(QAbstractListModel):
+    """Flat list of entity ids for the large entity lists, with base game rows greyed out"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[str] = []
+        self._base_game: List[bool] = []
+        self._base_brush = QBrush(QColor(150, 150, 150))
+        self._base_font = QFont()
+        self._base_font.setItalic(True)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return "Base game version" if self._base_game[row] else "Mod version"
+        if role == BASE_GAME_ROLE:
+            return self._base_game[row]
+        if self._base_game[row]:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._base_brush
+            if role == Qt.ItemDataRole.FontRole:
+                return self._base_font
+        return None
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows = []
+        self._base_game = []
+        self.endResetModel()
+
+    def set_rows(self, mod_ids: List[str], base_ids: List[str]):
+        """Replace the contents with mod ids followed by base game ids"""
+        self.beginResetModel()
+        self._rows = list(mod_ids) + list(base_ids)
+        self._base_game = [False] * len(mod_ids) + [True] * len(base_ids)
+        self.endResetModel()
+
+    def append_rows(self, ids: List[str], is_base_game: bool = False):
+        """Append ids to the end of the list in a single insert"""
+        if not ids:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(ids) - 1)
+        self._rows.extend(ids)
+        self._base_game.extend([is_base_game] * len(ids))
+        self.endInsertRows()
+
+    def row_text(self, row: int) -> str:
+        return self._rows[row]
+
+    def is_base_game(self, row: int) -> bool:
+        return self._base_game[row]
+
+    def find_row(self, text: str) -> int:
+        """Return the first row showing text, or -1"""
+        try:
+            return self._rows.index(text)
+        except ValueError:
+            return -1